@@ -0,0 +1,22 @@
+"""Console script entry point for ML Platform CLI."""
+
+import os
+import sys
+
+
+def main():
+    """Run the CLI, via the background daemon when MLP_USE_DAEMON=1."""
+    if os.environ.get("MLP_USE_DAEMON") == "1":
+        from mlp.daemon import forward
+
+        exit_code = forward(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from mlp.cli import cli
+
+    cli(prog_name="mlp")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,43 @@
 """Main CLI entry point for ML Platform CLI."""
 
+import importlib
 import click
-from rich.console import Console
 from mlp.config import Config
 
-console = Console()
 
-
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are invoked."""
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Maps command name -> (module path, attribute name)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr_name = self.lazy_subcommands[cmd_name]
+            module = importlib.import_module(module_name)
+            return getattr(module, attr_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "init": ("mlp.commands.init", "init_cmd"),
+        "experiment": ("mlp.commands.experiment", "experiment"),
+        "model": ("mlp.commands.model", "model"),
+        "daemon": ("mlp.commands.daemon", "daemon"),
+        # Future command groups (to be added later):
+        # "data": ("mlp.commands.data", "data"),
+        # "pipeline": ("mlp.commands.pipeline", "pipeline"),
+        # "monitor": ("mlp.commands.monitor", "monitor"),
+        # "cost": ("mlp.commands.cost", "cost"),
+    },
+)
 @click.version_option(version="0.1.0")
 @click.pass_context
 def cli(ctx):
@@ -17,20 +47,5 @@ def cli(ctx):
     ctx.obj['config'] = Config.load()
 
 
-# Import and register commands
-# We'll add these as we create them
-from mlp.commands import init, experiment, model
-
-cli.add_command(init.init_cmd)
-cli.add_command(experiment.experiment)
-cli.add_command(model.model)
-
-# Future command groups (to be added later):
-# cli.add_command(data.data)
-# cli.add_command(pipeline.pipeline)
-# cli.add_command(monitor.monitor)
-# cli.add_command(cost.cost)
-
-
 if __name__ == "__main__":
     cli()
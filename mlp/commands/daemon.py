@@ -0,0 +1,86 @@
+"""Manage the optional background daemon that keeps the CLI warm."""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+import click
+from mlp import daemon as mlp_daemon
+from mlp.utils.logger import console
+
+
+@click.group(name="daemon")
+def daemon():
+    """Run a background process that speeds up repeated CLI calls.
+
+    While the daemon is running, set MLP_USE_DAEMON=1 to route
+    non-interactive commands through it.
+    """
+    pass
+
+
+@daemon.command(name="start")
+def start_cmd():
+    """Start the background daemon."""
+    if not mlp_daemon.is_supported():
+        console().print("[bold red]Error:[/bold red] The daemon requires Unix sockets and fork()")
+        raise click.Abort()
+
+    if mlp_daemon.ping():
+        console().print("[yellow]Daemon is already running[/yellow]")
+        return
+
+    log_path = mlp_daemon.get_socket_path().parent / "daemon.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "ab") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "mlp.daemon"],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+    # Wait for the socket to come up
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        if mlp_daemon.ping():
+            console().print("[bold green]✓[/bold green] Daemon started")
+            console().print("[dim]Set MLP_USE_DAEMON=1 to route commands through it[/dim]")
+            return
+        time.sleep(0.1)
+
+    console().print(f"[bold red]Error:[/bold red] Daemon did not start. See {log_path}")
+    raise click.Abort()
+
+
+@daemon.command(name="stop")
+def stop_cmd():
+    """Stop the background daemon."""
+    pid_path = mlp_daemon.get_pid_path()
+    try:
+        pid = int(pid_path.read_text())
+    except (OSError, ValueError):
+        console().print("[yellow]Daemon is not running[/yellow]")
+        return
+
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        # Stale files from a daemon that did not shut down cleanly
+        for path in (pid_path, mlp_daemon.get_socket_path()):
+            path.unlink(missing_ok=True)
+        console().print("[yellow]Daemon is not running[/yellow]")
+        return
+
+    console().print("[bold green]✓[/bold green] Daemon stopped")
+
+
+@daemon.command(name="status")
+def status_cmd():
+    """Show whether the background daemon is running."""
+    if mlp_daemon.ping():
+        console().print("[bold green]Daemon is running[/bold green]")
+    else:
+        console().print("[dim]Daemon is not running[/dim]")
@@ -1,24 +1,105 @@
 """Experiment management commands for ML Platform CLI."""
 
 import click
+import functools
+import hashlib
 import os
 import yaml
 import subprocess
 import json
+import re
 from pathlib import Path
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
 from mlp.config import Config
+from mlp.utils.cache import read_json_cache, write_json_cache
+from mlp.utils.env import parse_env_vars
 from mlp.utils.validators import validate_name
-from mlp.utils.logger import setup_logger
+from mlp.utils.logger import console, setup_logger
 
-console = Console()
 logger = setup_logger(__name__)
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# Top-level "framework: <name>" key in experiment.yaml
+_FRAMEWORK_KEY_RE = re.compile(rb'^framework:[ \t]*(\w+)[ \t]*(?:#.*)?$', re.M)
+
+# requirements.txt signatures, checked in priority order. Anchored to the start
+# of a line so commented-out requirements are ignored.
+_FRAMEWORK_PATTERNS = [
+    (re.compile(rb'(?im)^[ \t]*(?:py)?torch'), "pytorch"),
+    (re.compile(rb'(?im)^[ \t]*tensorflow'), "tensorflow"),
+    (re.compile(rb'(?im)^[ \t]*scikit-learn'), "sklearn"),
+]
+
+_TRAINING_IMAGE_ENV_VARS = (
+    "MLP_TRAINING_IMAGE_PYTORCH",
+    "MLP_TRAINING_IMAGE_TENSORFLOW",
+    "MLP_TRAINING_IMAGE_SKLEARN",
+)
+
+# Terraform ECR repository output suffix -> frameworks that use its image
+_ECR_REPOSITORY_FRAMEWORKS = [
+    ("pytorch", ("pytorch",)),
+    ("tensorflow", ("tensorflow",)),
+    ("sklearn", ("sklearn", "simple")),  # simple uses sklearn image
+]
+
+TF_OUTPUTS_CACHE = "tf-outputs.json"
+FRAMEWORK_CACHE = "framework.json"
+
 
-def load_training_images_from_terraform():
-    """Load training image URLs from Terraform outputs."""
+def load_terraform_outputs(terraform_dir, cache_ttl_seconds=3600):
+    """Load Terraform outputs for a working directory.
+
+    Reads the local terraform.tfstate directly when present. Only for remote
+    or missing state does this fall back to ``terraform output -json``, whose
+    result is cached on disk for ``cache_ttl_seconds``.
+
+    Returns:
+        Dict of output name to ``{"value": ...}``, or None if unavailable
+    """
+    state_path = terraform_dir / "terraform.tfstate"
+    try:
+        outputs = json.loads(state_path.read_bytes()).get("outputs")
+        if outputs:
+            return outputs
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not read local Terraform state: {e}")
+
+    outputs = read_json_cache(
+        TF_OUTPUTS_CACHE,
+        ttl=cache_ttl_seconds,
+        newer_than=state_path
+    )
+    if outputs is not None:
+        return outputs
+
+    # Keep stdout as bytes: json.loads accepts them directly, which avoids
+    # decoding the whole payload into an intermediate str
+    result = subprocess.run(
+        ["terraform", "output", "-json"],
+        cwd=terraform_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        timeout=10
+    )
+    if result.returncode != 0:
+        return None
+
+    outputs = json.loads(result.stdout)
+    write_json_cache(TF_OUTPUTS_CACHE, outputs)
+    return outputs
+
+
+@functools.lru_cache(maxsize=1)
+def get_training_images(cache_ttl_seconds=3600):
+    """Load training image URLs from Terraform outputs.
+
+    Memoized so Terraform is only consulted once, and only by commands that
+    actually need an image (``experiment run`` without ``--image``).
+    """
     default_images = {
         "pytorch": os.getenv("MLP_TRAINING_IMAGE_PYTORCH", "python:3.10-slim"),
         "tensorflow": os.getenv("MLP_TRAINING_IMAGE_TENSORFLOW", "python:3.10-slim"),
@@ -26,29 +107,25 @@ def load_training_images_from_terraform():
         "simple": os.getenv("MLP_TRAINING_IMAGE_SKLEARN", "python:3.10-slim"),  # simple uses sklearn image
     }
 
+    # Nothing left for Terraform to fill in when every image is set explicitly
+    if all(os.getenv(var) for var in _TRAINING_IMAGE_ENV_VARS):
+        return default_images
+
     try:
         # Find terraform directory relative to this file
         terraform_dir = Path(__file__).parent.parent.parent / "terraform" / "aws"
         if not terraform_dir.exists():
             return default_images
 
-        result = subprocess.run(
-            ["terraform", "output", "-json"],
-            cwd=terraform_dir,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        outputs = load_terraform_outputs(terraform_dir, cache_ttl_seconds)
 
-        if result.returncode == 0:
-            outputs = json.loads(result.stdout)
-            if "ecr_repository_pytorch" in outputs:
-                default_images["pytorch"] = f"{outputs['ecr_repository_pytorch']['value']}:latest"
-            if "ecr_repository_tensorflow" in outputs:
-                default_images["tensorflow"] = f"{outputs['ecr_repository_tensorflow']['value']}:latest"
-            if "ecr_repository_sklearn" in outputs:
-                default_images["sklearn"] = f"{outputs['ecr_repository_sklearn']['value']}:latest"
-                default_images["simple"] = f"{outputs['ecr_repository_sklearn']['value']}:latest"
+        if outputs is not None:
+            for repo_key, frameworks in _ECR_REPOSITORY_FRAMEWORKS:
+                repo = outputs.get(f"ecr_repository_{repo_key}")
+                if repo:
+                    image = f"{repo['value']}:latest"
+                    for framework in frameworks:
+                        default_images[framework] = image
 
     except Exception as e:
         logger.debug(f"Could not load images from Terraform: {e}")
@@ -56,22 +133,84 @@ def load_training_images_from_terraform():
     return default_images
 
 
-# Load default training images at module level
-DEFAULT_TRAINING_IMAGES = load_training_images_from_terraform()
+def _mtime_ns(path):
+    """Get a file's modification time in nanoseconds, or None if missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
 
 
 def detect_framework(experiment_path):
-    """Detect the ML framework used in an experiment."""
-    experiment_path = Path(experiment_path)
+    """Detect the ML framework used in an experiment.
+
+    Results are cached in ~/.mlp/cache/framework.json and reused while
+    experiment.yaml and requirements.txt are unchanged.
+    """
+    experiment_path = Path(experiment_path).resolve()
+    mtimes = [
+        _mtime_ns(experiment_path / "experiment.yaml"),
+        _mtime_ns(experiment_path / "requirements.txt"),
+    ]
+    key = hashlib.blake2b(str(experiment_path).encode(), digest_size=8).hexdigest()
+
+    cache = read_json_cache(FRAMEWORK_CACHE)
+    if not isinstance(cache, dict):
+        cache = {}
+    entry = cache.get(key)
+    if entry and entry[1:] == mtimes:
+        return entry[0]
+
+    framework = _detect_framework_uncached(experiment_path)
+
+    cache[key] = [framework, *mtimes]
+    try:
+        write_json_cache(FRAMEWORK_CACHE, cache)
+    except OSError as e:
+        logger.debug(f"Could not write framework cache: {e}")
+
+    return framework
+
+
+def load_experiment_config(experiment_path):
+    """Load an experiment's experiment.yaml with a single parse.
+
+    Args:
+        experiment_path: Path to experiment directory
+
+    Returns:
+        Tuple of (config dict, framework or None if not declared)
+    """
+    experiment_yaml = Path(experiment_path) / "experiment.yaml"
+    try:
+        data = experiment_yaml.read_bytes()
+    except OSError:
+        return {}, None
+    return _parse_experiment_config(data)
 
+
+def _parse_experiment_config(data):
+    """Parse raw experiment.yaml bytes into (config dict, framework or None)."""
+    config = yaml.load(data, Loader=SafeLoader)
+    if not isinstance(config, dict):
+        return {}, None
+    return config, config.get("framework")
+
+
+def _detect_framework_uncached(experiment_path):
+    """Detect the ML framework by inspecting the experiment's files."""
     # Check for experiment.yaml
     experiment_yaml = experiment_path / "experiment.yaml"
     if experiment_yaml.exists():
         try:
-            with open(experiment_yaml, 'r') as f:
-                config = yaml.safe_load(f)
-                if config and "framework" in config:
-                    return config["framework"]
+            data = experiment_yaml.read_bytes()
+            # Fast path: avoid a full YAML parse for a plain top-level key
+            match = _FRAMEWORK_KEY_RE.search(data)
+            if match:
+                return match.group(1).decode()
+            _, framework = _parse_experiment_config(data)
+            if framework:
+                return framework
         except Exception as e:
             logger.debug(f"Could not read experiment.yaml: {e}")
 
@@ -79,12 +218,10 @@ def detect_framework(experiment_path):
     requirements_txt = experiment_path / "requirements.txt"
     if requirements_txt.exists():
         try:
-            with open(requirements_txt, 'r') as f:
-                content = f.read().lower()
-                if "torch" in content or "pytorch" in content:
-                    return "pytorch"
-                elif "tensorflow" in content:
-                    return "tensorflow"
+            content = requirements_txt.read_bytes()
+            for pattern, framework in _FRAMEWORK_PATTERNS:
+                if pattern.search(content):
+                    return framework
         except Exception as e:
             logger.debug(f"Could not read requirements.txt: {e}")
 
@@ -137,7 +274,7 @@ def create(ctx, name, path, template, force):
     """
     # Validate experiment name
     if not validate_name(name):
-        console.print(
+        console().print(
             "[bold red]Error:[/bold red] Invalid experiment name. "
             "Use lowercase alphanumeric, hyphens, and underscores (3-50 chars)"
         )
@@ -148,15 +285,15 @@ def create(ctx, name, path, template, force):
 
     # Check if directory exists
     if target_path.exists() and not force:
-        console.print(
+        console().print(
             f"[bold red]Error:[/bold red] Directory '{target_path}' already exists. "
             "Use --force to overwrite."
         )
         raise click.Abort()
 
-    console.print(f"[bold blue]Creating experiment:[/bold blue] {name}")
-    console.print(f"[dim]Template: {template}[/dim]")
-    console.print(f"[dim]Location: {target_path}[/dim]\n")
+    console().print(f"[bold blue]Creating experiment:[/bold blue] {name}")
+    console().print(f"[dim]Template: {template}[/dim]")
+    console().print(f"[dim]Location: {target_path}[/dim]\n")
 
     # Import template scaffolding
     from mlp.utils.templates import scaffold_project
@@ -164,16 +301,16 @@ def create(ctx, name, path, template, force):
     try:
         scaffold_project(name, target_path, template, force)
 
-        console.print(f"\n[bold green]✓[/bold green] Experiment '{name}' created successfully!")
-        console.print(f"\n[bold]Next steps:[/bold]")
-        console.print(f"  1. cd {name}")
-        console.print(f"  2. pip install -r requirements.txt")
-        console.print(f"  3. Edit train.py with your model code")
-        console.print(f"  4. mlp experiment run {name}")
+        console().print(f"\n[bold green]✓[/bold green] Experiment '{name}' created successfully!")
+        console().print(f"\n[bold]Next steps:[/bold]")
+        console().print(f"  1. cd {name}")
+        console().print(f"  2. pip install -r requirements.txt")
+        console().print(f"  3. Edit train.py with your model code")
+        console().print(f"  4. mlp experiment run {name}")
 
     except Exception as e:
         logger.error(f"Failed to create experiment: {e}")
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        console().print(f"[bold red]Error:[/bold red] {e}")
         raise click.Abort()
 
 
@@ -234,6 +371,9 @@ def run(ctx, experiment_path, name, image, cpu, memory, gpu, env, wait):
         mlp experiment run ./my-model -e LEARNING_RATE=0.001 -e EPOCHS=10
         mlp experiment run ./my-model --image custom-image:latest  # Override auto-detection
     """
+    from rich.prompt import Confirm
+    from rich.table import Table
+
     config = ctx.obj['config']
     experiment_path = Path(experiment_path).resolve()
 
@@ -243,7 +383,7 @@ def run(ctx, experiment_path, name, image, cpu, memory, gpu, env, wait):
 
     # Validate job name
     if not validate_name(name):
-        console.print(
+        console().print(
             "[bold red]Error:[/bold red] Invalid job name. "
             "Use lowercase alphanumeric, hyphens, and underscores (3-50 chars)"
         )
@@ -252,18 +392,17 @@ def run(ctx, experiment_path, name, image, cpu, memory, gpu, env, wait):
     # Auto-detect framework and select appropriate image if not specified
     if image is None:
         framework = detect_framework(experiment_path)
-        image = DEFAULT_TRAINING_IMAGES.get(framework, DEFAULT_TRAINING_IMAGES["sklearn"])
-        console.print(f"[dim]Auto-detected framework: {framework}[/dim]")
-        console.print(f"[dim]Using custom image: {image}[/dim]\n")
+        images = get_training_images(config.terraform.cache_ttl_seconds)
+        image = images.get(framework, images["sklearn"])
+        console().print(f"[dim]Auto-detected framework: {framework}[/dim]")
+        console().print(f"[dim]Using custom image: {image}[/dim]\n")
 
     # Parse environment variables
-    env_vars = {}
-    for e in env:
-        if "=" not in e:
-            console.print(f"[bold red]Error:[/bold red] Invalid env var format: {e}. Use KEY=VALUE")
-            raise click.Abort()
-        key, value = e.split("=", 1)
-        env_vars[key] = value
+    try:
+        env_vars = parse_env_vars(env)
+    except click.BadParameter as e:
+        console().print(f"[bold red]Error:[/bold red] {e.message}")
+        raise click.Abort()
 
     # Add MLflow tracking URI to env vars
     # Use internal Kubernetes service URL for jobs running in cluster
@@ -272,10 +411,10 @@ def run(ctx, experiment_path, name, image, cpu, memory, gpu, env, wait):
     env_vars["MLFLOW_EXPERIMENT_NAME"] = name
 
     # Display job configuration
-    console.print(f"[bold blue]Submitting experiment:[/bold blue] {name}")
-    console.print(f"[dim]Path: {experiment_path}[/dim]")
-    console.print(f"[dim]Kubernetes context: {config.kubernetes.context}[/dim]")
-    console.print(f"[dim]Namespace: {config.kubernetes.namespace}[/dim]\n")
+    console().print(f"[bold blue]Submitting experiment:[/bold blue] {name}")
+    console().print(f"[dim]Path: {experiment_path}[/dim]")
+    console().print(f"[dim]Kubernetes context: {config.kubernetes.context}[/dim]")
+    console().print(f"[dim]Namespace: {config.kubernetes.namespace}[/dim]\n")
 
     table = Table(title="Job Configuration")
     table.add_column("Resource", style="cyan")
@@ -286,29 +425,29 @@ def run(ctx, experiment_path, name, image, cpu, memory, gpu, env, wait):
     table.add_row("Memory", memory)
     table.add_row("GPU", str(gpu) if gpu > 0 else "None")
 
-    console.print(table)
-    console.print()
+    console().print(table)
+    console().print()
 
     # Show environment variables if any
     if env_vars:
-        console.print("[bold]Environment Variables:[/bold]")
+        console().print("[bold]Environment Variables:[/bold]")
         for key, value in env_vars.items():
             if "MLFLOW" in key:
-                console.print(f"  [dim]{key}={value}[/dim]")
+                console().print(f"  [dim]{key}={value}[/dim]")
             else:
-                console.print(f"  {key}={value}")
-        console.print()
+                console().print(f"  {key}={value}")
+        console().print()
 
     # Confirm submission
     if not Confirm.ask("Submit this job to Kubernetes?", default=True):
-        console.print("[yellow]Job submission cancelled[/yellow]")
+        console().print("[yellow]Job submission cancelled[/yellow]")
         return
 
     # Submit job to Kubernetes
     from mlp.utils.k8s import submit_training_job, wait_for_job, stream_job_logs
 
     try:
-        console.print("[yellow]Submitting job to Kubernetes...[/yellow]")
+        console().print("[yellow]Submitting job to Kubernetes...[/yellow]")
 
         job_name = submit_training_job(
             name=name,
@@ -321,23 +460,23 @@ def run(ctx, experiment_path, name, image, cpu, memory, gpu, env, wait):
             config=config
         )
 
-        console.print(f"[bold green]✓[/bold green] Job '{job_name}' submitted successfully!")
-        console.print(f"\n[bold]Monitor job:[/bold]")
-        console.print(f"  kubectl get job {job_name} -n {config.kubernetes.namespace}")
-        console.print(f"  kubectl logs -f job/{job_name} -n {config.kubernetes.namespace}")
-        console.print(f"\n[bold]MLflow:[/bold]")
-        console.print(f"  Track experiment at: {config.mlflow.tracking_uri}")
+        console().print(f"[bold green]✓[/bold green] Job '{job_name}' submitted successfully!")
+        console().print(f"\n[bold]Monitor job:[/bold]")
+        console().print(f"  kubectl get job {job_name} -n {config.kubernetes.namespace}")
+        console().print(f"  kubectl logs -f job/{job_name} -n {config.kubernetes.namespace}")
+        console().print(f"\n[bold]MLflow:[/bold]")
+        console().print(f"  Track experiment at: {config.mlflow.tracking_uri}")
 
         # Wait for job if requested
         if wait:
-            console.print(f"\n[yellow]Waiting for job to start...[/yellow]")
+            console().print(f"\n[yellow]Waiting for job to start...[/yellow]")
             wait_for_job(job_name, config.kubernetes.namespace)
-            console.print(f"[bold green]Job started. Streaming logs...[/bold green]\n")
+            console().print(f"[bold green]Job started. Streaming logs...[/bold green]\n")
             stream_job_logs(job_name, config.kubernetes.namespace)
 
     except Exception as e:
         logger.error(f"Failed to submit job: {e}")
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        console().print(f"[bold red]Error:[/bold red] {e}")
         raise click.Abort()
 
 
@@ -355,17 +494,19 @@ def list_experiments(ctx, status):
 
     Shows the status of training jobs submitted via 'mlp experiment run'.
     """
+    from rich.table import Table
+
     config = ctx.obj['config']
 
     from mlp.utils.k8s import list_jobs
 
     try:
-        console.print(f"[bold blue]Experiments in {config.kubernetes.namespace}[/bold blue]\n")
+        console().print(f"[bold blue]Experiments in {config.kubernetes.namespace}[/bold blue]\n")
 
         jobs = list_jobs(config.kubernetes.namespace, status)
 
         if not jobs:
-            console.print("[dim]No experiments found[/dim]")
+            console().print("[dim]No experiments found[/dim]")
             return
 
         table = Table()
@@ -382,9 +523,9 @@ def list_experiments(ctx, status):
                 f"{job['completions']}/1"
             )
 
-        console.print(table)
+        console().print(table)
 
     except Exception as e:
         logger.error(f"Failed to list experiments: {e}")
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        console().print(f"[bold red]Error:[/bold red] {e}")
         raise click.Abort()
@@ -1,20 +1,11 @@
 """Model deployment and management commands."""
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.prompt import Confirm
-from mlp.utils.k8s import (
-    deploy_model,
-    list_model_deployments,
-    delete_model_deployment,
-    get_model_service_url
-)
+from mlp.utils.env import parse_env_vars
 from mlp.utils.validators import validate_name
-from mlp.utils.logger import setup_logger
+from mlp.utils.logger import console, setup_logger
 
 logger = setup_logger(__name__)
-console = Console()
 
 
 @click.group()
@@ -70,31 +61,31 @@ def deploy_cmd(ctx, model_name, model_uri, replicas, cpu, memory, port, env):
         mlp model deploy my-model --model-uri models:/my-model/1
         mlp model deploy my-model --model-uri runs:/abc123/model --replicas 3
     """
+    from rich.prompt import Confirm
+    from rich.table import Table
+
     config = ctx.obj['config']
 
     # Validate model name
     if not validate_name(model_name):
-        console.print(
+        console().print(
             "[red]✗[/red] Invalid model name. Use only lowercase letters, numbers, "
             "hyphens, and underscores (3-50 characters)."
         )
         raise click.Abort()
 
     # Parse environment variables
-    env_dict = {}
-    for e in env:
-        if "=" not in e:
-            console.print(f"[red]✗[/red] Invalid environment variable format: {e}")
-            console.print("Use KEY=VALUE format")
-            raise click.Abort()
-        key, value = e.split("=", 1)
-        env_dict[key] = value
+    try:
+        env_dict = parse_env_vars(env)
+    except click.BadParameter as e:
+        console().print(f"[red]✗[/red] {e.message}")
+        raise click.Abort()
 
     # Add MLflow tracking URI to environment
     env_dict["MLFLOW_TRACKING_URI"] = config.mlflow.tracking_uri
 
     # Display deployment configuration
-    console.print("\n[bold]Model Deployment Configuration[/bold]")
+    console().print("\n[bold]Model Deployment Configuration[/bold]")
     table = Table(show_header=False)
     table.add_column("Property", style="cyan")
     table.add_column("Value", style="white")
@@ -110,14 +101,16 @@ def deploy_cmd(ctx, model_name, model_uri, replicas, cpu, memory, port, env):
     if env_dict:
         table.add_row("Environment", "\n".join([f"{k}={v}" for k, v in env_dict.items()]))
 
-    console.print(table)
-    console.print()
+    console().print(table)
+    console().print()
 
     # Confirm deployment
     if not Confirm.ask("Deploy this model?", default=True):
-        console.print("[yellow]Deployment cancelled[/yellow]")
+        console().print("[yellow]Deployment cancelled[/yellow]")
         return
 
+    from mlp.utils.k8s import deploy_model, get_model_service_url
+
     try:
         # Deploy the model
         deploy_model(
@@ -131,22 +124,22 @@ def deploy_cmd(ctx, model_name, model_uri, replicas, cpu, memory, port, env):
             env=env_dict,
         )
 
-        console.print(f"\n[green]✓[/green] Model '{model_name}' deployed successfully!")
+        console().print(f"\n[green]✓[/green] Model '{model_name}' deployed successfully!")
 
         # Get service URL
         service_url = get_model_service_url(model_name, config.kubernetes.namespace)
         if service_url:
-            console.print(f"\n[bold]Service URL:[/bold] {service_url}")
-            console.print("\nTo test the endpoint:")
-            console.print(f"  curl -X POST {service_url}/invocations -H 'Content-Type: application/json' -d '{{\"data\": [[1,2,3,4]]}}'")
+            console().print(f"\n[bold]Service URL:[/bold] {service_url}")
+            console().print("\nTo test the endpoint:")
+            console().print(f"  curl -X POST {service_url}/invocations -H 'Content-Type: application/json' -d '{{\"data\": [[1,2,3,4]]}}'")
 
-        console.print(f"\nTo check deployment status:")
-        console.print(f"  kubectl get deployment {model_name} -n {config.kubernetes.namespace}")
-        console.print(f"  kubectl get pods -l app={model_name} -n {config.kubernetes.namespace}")
+        console().print(f"\nTo check deployment status:")
+        console().print(f"  kubectl get deployment {model_name} -n {config.kubernetes.namespace}")
+        console().print(f"  kubectl get pods -l app={model_name} -n {config.kubernetes.namespace}")
 
     except Exception as e:
         logger.exception("Failed to deploy model")
-        console.print(f"\n[red]✗[/red] Failed to deploy model: {str(e)}")
+        console().print(f"\n[red]✗[/red] Failed to deploy model: {str(e)}")
         raise click.Abort()
 
 
@@ -166,8 +159,12 @@ def list_cmd(ctx, status):
         mlp model list
         mlp model list --status available
     """
+    from rich.table import Table
+
     config = ctx.obj['config']
 
+    from mlp.utils.k8s import list_model_deployments
+
     try:
         deployments = list_model_deployments(
             namespace=config.kubernetes.namespace,
@@ -175,7 +172,7 @@ def list_cmd(ctx, status):
         )
 
         if not deployments:
-            console.print(f"\n[yellow]No model deployments found in namespace '{config.kubernetes.namespace}'[/yellow]")
+            console().print(f"\n[yellow]No model deployments found in namespace '{config.kubernetes.namespace}'[/yellow]")
             return
 
         # Display deployments table
@@ -195,11 +192,11 @@ def list_cmd(ctx, status):
                 dep["service_url"] or "N/A",
             )
 
-        console.print(table)
+        console().print(table)
 
     except Exception as e:
         logger.exception("Failed to list model deployments")
-        console.print(f"\n[red]✗[/red] Failed to list deployments: {str(e)}")
+        console().print(f"\n[red]✗[/red] Failed to list deployments: {str(e)}")
         raise click.Abort()
 
 
@@ -219,6 +216,8 @@ def delete_cmd(ctx, model_name, force):
         mlp model delete my-model
         mlp model delete my-model --force
     """
+    from rich.prompt import Confirm
+
     config = ctx.obj['config']
 
     # Confirm deletion
@@ -227,20 +226,22 @@ def delete_cmd(ctx, model_name, force):
             f"Are you sure you want to delete model deployment '{model_name}'?",
             default=False
         ):
-            console.print("[yellow]Deletion cancelled[/yellow]")
+            console().print("[yellow]Deletion cancelled[/yellow]")
             return
 
+    from mlp.utils.k8s import delete_model_deployment
+
     try:
         delete_model_deployment(
             model_name=model_name,
             namespace=config.kubernetes.namespace
         )
 
-        console.print(f"\n[green]✓[/green] Model deployment '{model_name}' deleted successfully!")
+        console().print(f"\n[green]✓[/green] Model deployment '{model_name}' deleted successfully!")
 
     except Exception as e:
         logger.exception("Failed to delete model deployment")
-        console.print(f"\n[red]✗[/red] Failed to delete deployment: {str(e)}")
+        console().print(f"\n[red]✗[/red] Failed to delete deployment: {str(e)}")
         raise click.Abort()
 
 
@@ -272,7 +273,7 @@ def logs_cmd(ctx, model_name, follow, tail):
     try:
         from mlp.utils.k8s import stream_deployment_logs
 
-        console.print(f"\n[bold]Logs for model '{model_name}'[/bold]\n")
+        console().print(f"\n[bold]Logs for model '{model_name}'[/bold]\n")
 
         stream_deployment_logs(
             deployment_name=model_name,
@@ -282,8 +283,8 @@ def logs_cmd(ctx, model_name, follow, tail):
         )
 
     except KeyboardInterrupt:
-        console.print("\n[yellow]Log streaming interrupted[/yellow]")
+        console().print("\n[yellow]Log streaming interrupted[/yellow]")
     except Exception as e:
         logger.exception("Failed to fetch logs")
-        console.print(f"\n[red]✗[/red] Failed to fetch logs: {str(e)}")
+        console().print(f"\n[red]✗[/red] Failed to fetch logs: {str(e)}")
         raise click.Abort()
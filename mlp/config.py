@@ -1,48 +1,116 @@
 """Configuration management for ML Platform CLI."""
 
+import os
 from pathlib import Path
 import yaml
-from pydantic import BaseModel, Field
-from typing import Optional
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, Optional, Tuple
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
 
-class KubernetesConfig(BaseModel):
+# (path, mtime) of the last loaded config file and the resulting Config
+_cached: Optional[Tuple[Tuple[str, float], "Config"]] = None
+
+
+@dataclass(slots=True)
+class KubernetesConfig:
     """Kubernetes configuration settings."""
     context: str = "kind-mlp"
     namespace: str = "ml-platform"
+    # S3 prefix for code bundles (e.g. s3://mlp-artifacts/code); ConfigMaps are used when empty
+    code_bundle_uri: str = ""
+    # PersistentVolumeClaim shared by training jobs as a pip cache; disabled when empty
+    pip_cache_pvc: str = ""
 
 
-class MLflowConfig(BaseModel):
+@dataclass(slots=True)
+class MLflowConfig:
     """MLflow configuration settings."""
     tracking_uri: str = "http://localhost:5000"
     artifact_root: str = "s3://mlp-artifacts"
 
 
-class DVCConfig(BaseModel):
+@dataclass(slots=True)
+class DVCConfig:
     """DVC configuration settings."""
     remote: str = "s3://mlp-data"
 
 
-class Config(BaseModel):
+@dataclass(slots=True)
+class TerraformConfig:
+    """Terraform integration settings."""
+    cache_ttl_seconds: int = 3600
+
+
+def _section_from_dict(section_cls, data: Optional[Dict[str, Any]]):
+    """Build a config section, ignoring unknown keys."""
+    if not data:
+        return section_cls()
+    known = {f.name for f in fields(section_cls)}
+    return section_cls(**{k: v for k, v in data.items() if k in known})
+
+
+@dataclass(slots=True)
+class Config:
     """Main configuration model."""
-    kubernetes: KubernetesConfig = Field(default_factory=KubernetesConfig)
-    mlflow: MLflowConfig = Field(default_factory=MLflowConfig)
-    dvc: DVCConfig = Field(default_factory=DVCConfig)
+    kubernetes: KubernetesConfig = field(default_factory=KubernetesConfig)
+    mlflow: MLflowConfig = field(default_factory=MLflowConfig)
+    dvc: DVCConfig = field(default_factory=DVCConfig)
+    terraform: TerraformConfig = field(default_factory=TerraformConfig)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "Config":
+        """Build a Config from a parsed config.yaml mapping."""
+        data = data or {}
+        return cls(
+            kubernetes=_section_from_dict(KubernetesConfig, data.get("kubernetes")),
+            mlflow=_section_from_dict(MLflowConfig, data.get("mlflow")),
+            dvc=_section_from_dict(DVCConfig, data.get("dvc")),
+            terraform=_section_from_dict(TerraformConfig, data.get("terraform")),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the configuration to a plain dictionary."""
+        return asdict(self)
 
     @classmethod
     def load(cls) -> "Config":
-        """Load configuration from ~/.mlp/config.yaml."""
+        """Load configuration from ~/.mlp/config.yaml.
+
+        The parsed config is cached per process and only re-read when the
+        file's path or modification time changes.
+        """
+        global _cached
         config_path = Path.home() / ".mlp" / "config.yaml"
-        if config_path.exists():
-            with open(config_path) as f:
-                data = yaml.safe_load(f)
-                if data:
-                    return cls(**data)
-        return cls()
+        try:
+            mtime = config_path.stat().st_mtime
+        except OSError:
+            return cls()
+
+        key = (str(config_path), mtime)
+        if _cached is not None and _cached[0] == key:
+            return _cached[1]
+
+        with open(config_path) as f:
+            data = yaml.load(f, Loader=SafeLoader)
+        config = cls.from_dict(data)
+        _cached = (key, config)
+        return config
 
     def save(self):
         """Save configuration to ~/.mlp/config.yaml."""
         config_path = Path.home() / ".mlp" / "config.yaml"
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, "w") as f:
-            yaml.dump(self.model_dump(), f, default_flow_style=False, sort_keys=False)
+        content = yaml.dump(
+            self.to_dict(),
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False
+        )
+        # Write to a temp file and rename so a failed save never truncates the config
+        tmp_path = config_path.with_suffix(".yaml.tmp")
+        tmp_path.write_text(content)
+        os.replace(tmp_path, config_path)
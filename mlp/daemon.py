@@ -0,0 +1,236 @@
+"""Optional long-running daemon that keeps the CLI's imports warm.
+
+The daemon listens on a Unix socket (~/.mlp/sock). A client sends its argv,
+working directory and environment; the daemon forks a child (inheriting the
+already imported click/rich/kubernetes modules), runs the command there
+and sends back the exit code and captured output.
+
+This module only uses the standard library so the client side stays cheap.
+"""
+
+import io
+import json
+import os
+import shutil
+import signal
+import socket
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import List, Optional
+
+# Commands that prompt or stream output must run in the calling process
+_LOCAL_ONLY_COMMANDS = {
+    ("daemon",),
+    ("init",),
+    ("experiment", "run"),
+    ("model", "deploy"),
+    ("model", "delete"),
+    ("model", "logs"),
+}
+
+# Modules imported once in the daemon so forked children start warm
+_PRELOAD_MODULES = [
+    "mlp.cli",
+    "mlp.commands.experiment",
+    "mlp.commands.model",
+    "mlp.utils.k8s",
+]
+
+
+def get_socket_path() -> Path:
+    """Get the daemon's Unix socket path."""
+    return Path.home() / ".mlp" / "sock"
+
+
+def get_pid_path() -> Path:
+    """Get the daemon's PID file path."""
+    return Path.home() / ".mlp" / "daemon.pid"
+
+
+def is_supported() -> bool:
+    """Check whether the platform supports the daemon (Unix sockets + fork)."""
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "fork")
+
+
+def should_forward(argv: List[str]) -> bool:
+    """Check whether a command can be executed by the daemon.
+
+    Args:
+        argv: CLI arguments (without the program name)
+
+    Returns:
+        True unless the command is interactive or streams output
+    """
+    words = tuple(arg for arg in argv if not arg.startswith("-"))[:2]
+    return words[:1] not in _LOCAL_ONLY_COMMANDS and words not in _LOCAL_ONLY_COMMANDS
+
+
+def _recv_all(sock: socket.socket) -> bytes:
+    """Read from a socket until the peer shuts down its write side."""
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def _request(payload: dict, timeout: Optional[float] = None) -> Optional[dict]:
+    """Send a request to the daemon.
+
+    Returns:
+        Decoded response, or None if the daemon is not reachable
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(get_socket_path()))
+        sock.sendall(json.dumps(payload).encode())
+        sock.shutdown(socket.SHUT_WR)
+        return json.loads(_recv_all(sock))
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+
+def ping(timeout: float = 1.0) -> bool:
+    """Check whether the daemon is running and responsive."""
+    response = _request({"ping": True}, timeout=timeout)
+    return bool(response and response.get("ok"))
+
+
+def forward(argv: List[str]) -> Optional[int]:
+    """Run a CLI command through the daemon.
+
+    Args:
+        argv: CLI arguments (without the program name)
+
+    Returns:
+        Exit code, or None if the command must run locally (daemon not
+        running, unsupported platform, or interactive command)
+    """
+    if not is_supported() or not should_forward(argv):
+        return None
+    if not get_socket_path().exists():
+        return None
+
+    env = dict(os.environ)
+    # Rich sizes output for the daemon's (missing) terminal otherwise
+    env.setdefault("COLUMNS", str(shutil.get_terminal_size().columns))
+
+    response = _request({"argv": argv, "cwd": os.getcwd(), "env": env})
+    if response is None:
+        return None
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stderr.flush()
+    return response.get("exit_code", 1)
+
+
+def _run_command(request: dict) -> dict:
+    """Run one CLI invocation inside a forked daemon child."""
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+
+    from mlp.cli import cli
+    from mlp.utils.logger import console
+
+    # Re-detect the (non-)terminal for this invocation's captured output
+    console.cache_clear()
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            cli.main(args=request["argv"], prog_name="mlp")
+            exit_code = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                exit_code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+
+    return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def _handle_connection(conn: socket.socket) -> None:
+    """Handle a single client connection in a forked child."""
+    try:
+        request = json.loads(_recv_all(conn))
+        if request.get("ping"):
+            response = {"ok": True, "pid": os.getppid()}
+        else:
+            response = _run_command(request)
+    except Exception as e:
+        response = {"exit_code": 1, "stdout": "", "stderr": f"mlp daemon error: {e}\n"}
+
+    try:
+        conn.sendall(json.dumps(response).encode())
+    finally:
+        conn.close()
+
+
+def serve() -> None:
+    """Run the daemon loop until terminated."""
+    import importlib
+
+    for module in _PRELOAD_MODULES:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass
+
+    socket_path = get_socket_path()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        socket_path.unlink()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket is only accessible to the owner
+    try:
+        server.bind(str(socket_path))
+    finally:
+        os.umask(old_umask)
+    server.listen(16)
+
+    get_pid_path().write_text(str(os.getpid()))
+
+    def shutdown(signum, frame):
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, shutdown)
+    # Children are never waited on; let the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except InterruptedError:
+                continue
+            if os.fork() == 0:
+                try:
+                    server.close()
+                    # Commands may run subprocesses and must be able to wait on them
+                    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                    _handle_connection(conn)
+                finally:
+                    os._exit(0)
+            conn.close()
+    finally:
+        server.close()
+        for path in (socket_path, get_pid_path()):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+if __name__ == "__main__":
+    serve()
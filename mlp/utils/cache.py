@@ -0,0 +1,65 @@
+"""On-disk JSON cache stored under ~/.mlp/cache."""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+def get_cache_dir() -> Path:
+    """Get the directory used for persistent CLI caches."""
+    return Path.home() / ".mlp" / "cache"
+
+
+def read_json_cache(
+    name: str,
+    ttl: Optional[float] = None,
+    newer_than: Optional[Path] = None
+) -> Optional[Any]:
+    """Read a cached JSON document.
+
+    Args:
+        name: Cache file name (e.g. "tf-outputs.json")
+        ttl: Maximum age in seconds (None means no expiry)
+        newer_than: Treat the cache as stale if this file was modified after it
+
+    Returns:
+        Cached data, or None if missing, expired, or unreadable
+    """
+    cache_path = get_cache_dir() / name
+    try:
+        mtime = cache_path.stat().st_mtime
+    except OSError:
+        return None
+
+    if ttl is not None and time.time() - mtime >= ttl:
+        return None
+
+    if newer_than is not None:
+        try:
+            if newer_than.stat().st_mtime > mtime:
+                return None
+        except OSError:
+            pass
+
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_cache(name: str, data: Any) -> None:
+    """Atomically write a JSON document to the cache.
+
+    Args:
+        name: Cache file name (e.g. "tf-outputs.json")
+        data: JSON-serializable data
+    """
+    cache_path = get_cache_dir() / name
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, cache_path)
@@ -0,0 +1,193 @@
+"""Package experiment code as a compressed tarball for training jobs."""
+
+import gzip
+import io
+import os
+import tarfile
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Iterator, Optional
+from mlp.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Directories and file suffixes never shipped with experiment code
+EXCLUDE_DIRS = frozenset({
+    'mlruns', 'models', '.git', '__pycache__', '.ipynb_checkpoints',
+    'data', 'notebooks', '.dvc', '.pytest_cache', '.venv', 'venv', '.DS_Store'
+})
+EXCLUDE_SUFFIXES = ('.pyc', '.pyo', '.pyd', '.egg-info')
+
+# Larger than tarfile's 10KiB default to cut write calls on big trees
+TAR_BUFSIZE = 2 * 1024 * 1024
+
+# Files are read by a small thread pool ahead of the tar writer so reads
+# overlap on slow (e.g. network) filesystems; only files up to
+# READ_AHEAD_MAX_BYTES are buffered, larger ones stream from disk
+READ_AHEAD_WORKERS = 8
+READ_AHEAD_MAX_BYTES = 1024 * 1024
+
+# Presigned bundle URLs must outlive job retries
+BUNDLE_URL_EXPIRY_SECONDS = 86400
+
+
+def is_excluded(name: str) -> bool:
+    """Check if a file or directory name is left out of the code package.
+
+    Args:
+        name: Base name of a directory entry
+
+    Returns:
+        True if the name is excluded or has an excluded suffix
+    """
+    return name in EXCLUDE_DIRS or name.endswith(EXCLUDE_SUFFIXES)
+
+
+def iter_code_entries(path: Path) -> Iterator[os.DirEntry]:
+    """Yield directory entries for the files that should be shipped.
+
+    Excluded directories are pruned before descending, and directory
+    entries' cached file types avoid a stat() per entry. Symlinked
+    directories are not followed (so link cycles cannot loop the walk);
+    symlinked files are yielded and archived with their target's contents.
+
+    Args:
+        path: Experiment directory
+
+    Yields:
+        os.DirEntry for each file
+    """
+    stack = [os.fspath(path)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if is_excluded(entry.name):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+                elif entry.is_symlink() and entry.is_file():
+                    # Link to a file (possibly outside the tree); dangling
+                    # links and links to directories are skipped
+                    yield entry
+
+
+def iter_code_files(path: Path) -> Iterator[Path]:
+    """Yield the files under an experiment directory that should be shipped.
+
+    Args:
+        path: Experiment directory
+
+    Yields:
+        Absolute file paths
+    """
+    for entry in iter_code_entries(path):
+        yield Path(entry.path)
+
+
+def code_tree_size(path: Path) -> int:
+    """Get the total uncompressed size of the files that would be shipped.
+
+    Args:
+        path: Experiment directory
+
+    Returns:
+        Size in bytes, from stat() only (no file contents are read)
+    """
+    return sum(entry.stat().st_size for entry in iter_code_entries(path))
+
+
+def write_code_bundle(path: Path, fileobj: IO[bytes]) -> int:
+    """Stream an experiment directory into a gzipped tarball.
+
+    Args:
+        path: Experiment directory
+        fileobj: Binary file object to write the tar.gz stream to
+
+    Returns:
+        Number of files written
+    """
+    count = 0
+    # gzip level 6 is ~2x faster than tarfile's fixed level 9 for a
+    # slightly larger archive; mtime=0 leaves the build time out of the header.
+    # dereference=True stores symlinked files as regular members, since the
+    # entrypoint's "data" extraction filter rejects links pointing outside
+    # the tree.
+    with gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=6, mtime=0) as gz, \
+            tarfile.open(fileobj=gz, mode="w|", bufsize=TAR_BUFSIZE, dereference=True) as tar, \
+            ThreadPoolExecutor(max_workers=READ_AHEAD_WORKERS) as pool:
+        # Members are written in walk order; the window bounds buffered data.
+        # gettarinfo() stays on this thread because hard link detection
+        # depends on the order members are seen.
+        pending = deque()
+        for file_path in iter_code_files(path):
+            info = tar.gettarinfo(file_path, file_path.relative_to(path).as_posix())
+            pending.append((info, file_path, pool.submit(_read_small_file, info, file_path)))
+            if len(pending) >= 2 * READ_AHEAD_WORKERS:
+                _add_member(tar, *pending.popleft())
+                count += 1
+        while pending:
+            _add_member(tar, *pending.popleft())
+            count += 1
+    return count
+
+
+def _read_small_file(info: tarfile.TarInfo, file_path: Path) -> Optional[bytes]:
+    """Read a regular file's contents if it is small enough to buffer."""
+    if info.isreg() and info.size <= READ_AHEAD_MAX_BYTES:
+        return file_path.read_bytes()
+    return None
+
+
+def _add_member(
+    tar: tarfile.TarFile, info: tarfile.TarInfo, file_path: Path, read: Future
+) -> None:
+    """Write one member to the archive, using prefetched contents if available."""
+    data = read.result()
+    if data is not None:
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    elif info.isreg():
+        with open(file_path, "rb") as f:
+            tar.addfile(info, f)
+    else:
+        tar.addfile(info)
+
+
+def upload_code_bundle(path: Path, bundle_uri: str, job_name: str) -> str:
+    """Upload an experiment's code bundle to S3.
+
+    Args:
+        path: Experiment directory
+        bundle_uri: S3 prefix for bundles (e.g. s3://mlp-artifacts/code)
+        job_name: Job name, used as the bundle's file name
+
+    Returns:
+        Presigned HTTPS URL the job can download the bundle from
+    """
+    import boto3
+
+    if not bundle_uri.startswith("s3://"):
+        raise ValueError(f"Unsupported code bundle URI: {bundle_uri}. Use s3://bucket/prefix")
+
+    bucket, _, prefix = bundle_uri[len("s3://"):].partition("/")
+    key = f"{prefix.strip('/')}/{job_name}.tar.gz".lstrip("/")
+
+    s3 = boto3.client("s3")
+    # Stay in memory for typical repos, spill to disk for large ones
+    with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as buf:
+        count = write_code_bundle(path, buf)
+        size = buf.tell()
+        buf.seek(0)
+        s3.upload_fileobj(buf, bucket, key)
+
+    logger.info(f"Uploaded {count} files ({size / 1024:.1f} KB) to s3://{bucket}/{key}")
+
+    return s3.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": bucket, "Key": key},
+        ExpiresIn=BUNDLE_URL_EXPIRY_SECONDS
+    )
@@ -0,0 +1,42 @@
+"""Training container entrypoint.
+
+Unpacks the experiment code, installs its requirements and replaces itself
+with the training script. It runs inside the trainer image (passed via
+``python -c``), so it must only use the standard library.
+"""
+
+import os
+import subprocess
+import sys
+import tarfile
+
+WORK_DIR = "/work"
+
+
+def main(argv):
+    """Prepare the working directory and exec train.py.
+
+    Args:
+        argv: Command line; argv[1] is an optional code archive to unpack
+    """
+    os.makedirs(WORK_DIR, exist_ok=True)
+
+    if len(argv) > 1:
+        with tarfile.open(argv[1], "r:gz") as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(WORK_DIR, filter="data")
+            else:
+                tar.extractall(WORK_DIR)
+
+    os.chdir(WORK_DIR)
+
+    if os.path.exists("requirements.txt"):
+        result = subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        if result.returncode:
+            sys.exit(result.returncode)
+
+    os.execv(sys.executable, [sys.executable, "train.py"])
+
+
+if __name__ == "__main__":
+    main(sys.argv)
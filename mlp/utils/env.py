@@ -0,0 +1,30 @@
+"""Environment variable parsing utilities."""
+
+import re
+from typing import Dict, Iterable
+import click
+
+# KEY=VALUE where KEY is a valid shell/Kubernetes environment variable name
+_ENV_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)=(.*)$', re.S)
+
+
+def parse_env_vars(items: Iterable[str]) -> Dict[str, str]:
+    """
+    Parse KEY=VALUE environment variable options.
+
+    Args:
+        items: Raw option values (e.g. from a multiple=True Click option)
+
+    Returns:
+        Dictionary mapping variable names to values
+
+    Raises:
+        click.BadParameter: If an item is not KEY=VALUE or KEY is not a valid name
+    """
+    env_vars = {}
+    for item in items:
+        match = _ENV_RE.match(item)
+        if not match:
+            raise click.BadParameter(f"Invalid env var format: {item}. Use KEY=VALUE")
+        env_vars[match.group(1)] = match.group(2)
+    return env_vars
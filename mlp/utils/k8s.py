@@ -2,110 +2,167 @@
 
 import time
 import base64
+import io
+import secrets
+import sys
 import tempfile
 import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
-from kubernetes import client, config as k8s_config
+from typing import Dict, List, NamedTuple, Optional
+from kubernetes import client, config as k8s_config, watch
 from kubernetes.client.rest import ApiException
+from urllib3.util.ssl_ import create_urllib3_context
 from mlp.config import Config
+from mlp.utils.code_bundle import code_tree_size, upload_code_bundle, write_code_bundle
 from mlp.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Init container image that downloads code bundles (has curl and tar)
+CODE_FETCH_IMAGE = "curlimages/curl:8.10.1"
 
-def get_k8s_client(kubernetes_context: Optional[str] = None):
+# Mount path of the optional shared pip cache volume
+PIP_CACHE_DIR = "/pip-cache"
+
+
+class K8sClients(NamedTuple):
+    """Kubernetes API clients sharing one ApiClient and connection pool."""
+    batch: client.BatchV1Api
+    core: client.CoreV1Api
+    apps: client.AppsV1Api
+
+
+# Cached clients per kubeconfig context
+_CLIENT_CACHE: Dict[Optional[str], K8sClients] = {}
+
+
+def _share_ssl_context(api_client: client.ApiClient):
+    """Make every pooled connection reuse one pre-loaded SSL context.
+
+    urllib3 otherwise builds a fresh context per TLS connection and re-reads
+    the CA bundle and client certificate files from disk each time.
+
+    Args:
+        api_client: API client whose connection pool should be updated
+    """
+    configuration = api_client.configuration
+    if not configuration.verify_ssl:
+        return
+
+    context = create_urllib3_context()
+    if configuration.ssl_ca_cert or configuration.ca_cert_data:
+        context.load_verify_locations(
+            cafile=configuration.ssl_ca_cert,
+            cadata=configuration.ca_cert_data
+        )
+    else:
+        context.load_default_certs()
+    if configuration.cert_file:
+        context.load_cert_chain(configuration.cert_file, configuration.key_file)
+
+    api_client.rest_client.pool_manager.connection_pool_kw.update(
+        ssl_context=context,
+        ca_certs=None,
+        ca_cert_data=None,
+        cert_file=None,
+        key_file=None
+    )
+
+
+def get_k8s_client(kubernetes_context: Optional[str] = None) -> K8sClients:
     """Get Kubernetes API client.
 
+    Kubeconfig is only loaded the first time a context is requested; later
+    calls return the cached clients.
+
     Args:
         kubernetes_context: K8s context to use (defaults to current context)
 
     Returns:
-        Tuple of (BatchV1Api, CoreV1Api)
+        K8sClients with batch, core and apps API clients
     """
+    if kubernetes_context in _CLIENT_CACHE:
+        return _CLIENT_CACHE[kubernetes_context]
+
     try:
         # Load kubeconfig
         k8s_config.load_kube_config(context=kubernetes_context)
-        batch_api = client.BatchV1Api()
-        core_api = client.CoreV1Api()
-        return batch_api, core_api
+        configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = 20
+        api_client = client.ApiClient(configuration=configuration)
+        _share_ssl_context(api_client)
+        clients = K8sClients(
+            batch=client.BatchV1Api(api_client=api_client),
+            core=client.CoreV1Api(api_client=api_client),
+            apps=client.AppsV1Api(api_client=api_client),
+        )
     except Exception as e:
         logger.error(f"Failed to load Kubernetes config: {e}")
         raise
 
+    _CLIENT_CACHE[kubernetes_context] = clients
+    return clients
+
+
+# Standalone script run in the trainer container via python -c
+_ENTRYPOINT_PATH = Path(__file__).with_name("entrypoint.py")
+
+# ConfigMap key holding the gzipped code tarball
+CODE_ARCHIVE_KEY = "code.tar.gz"
+
+# Uncompressed source size that could not fit in a ConfigMap even at 10x compression
+_MAX_CONFIGMAP_SOURCE_BYTES = 32 * 1024 * 1024
+
 
 def create_configmap_from_path(
     name: str,
     namespace: str,
     path: Path,
-    core_api: client.CoreV1Api
+    core_api: client.CoreV1Api,
+    labels: Optional[Dict[str, str]] = None
 ) -> str:
-    """Create a ConfigMap from a directory.
+    """Create a ConfigMap holding a directory as a gzipped tarball.
 
     Args:
         name: ConfigMap name
         namespace: Kubernetes namespace
         path: Path to directory
         core_api: Kubernetes Core API client
+        labels: Labels to set on the ConfigMap
 
     Returns:
         ConfigMap name
     """
-    # Directories and patterns to exclude from ConfigMap
-    exclude_patterns = [
-        'mlruns', 'models', '.git', '__pycache__', '.ipynb_checkpoints',
-        'data', 'notebooks', '.dvc', '.pytest_cache', '.venv', 'venv',
-        '*.pyc', '*.pyo', '*.pyd', '.DS_Store', '*.egg-info'
-    ]
+    # Fail before reading anything if even ~10x compression could not fit
+    source_size = code_tree_size(path)
+    if source_size > _MAX_CONFIGMAP_SOURCE_BYTES:
+        raise ValueError(
+            f"Experiment code is {source_size / 1024 / 1024:.1f} MB, too large for a ConfigMap. "
+            "Exclude large files or set kubernetes.code_bundle_uri to ship code through S3."
+        )
+
+    # Source code compresses well, and one archive keeps the directory
+    # layout without flattening paths into ConfigMap keys
+    buf = io.BytesIO()
+    count = write_code_bundle(path, buf)
+    archive = base64.b64encode(buf.getbuffer()).decode("ascii")
+    total_size = len(archive)
 
-    def should_exclude(file_path: Path) -> bool:
-        """Check if file should be excluded from ConfigMap."""
-        relative = file_path.relative_to(path)
-        parts = relative.parts
-
-        # Check if any part of the path matches exclude patterns
-        for pattern in exclude_patterns:
-            # Check directory names
-            if pattern in parts:
-                return True
-            # Check file patterns (e.g., *.pyc)
-            if '*' in pattern and file_path.name.endswith(pattern[1:]):
-                return True
-        return False
-
-    # Read all files in directory
-    data = {}
-    total_size = 0
-    for file_path in path.rglob("*"):
-        if file_path.is_file() and not should_exclude(file_path):
-            relative_path = file_path.relative_to(path)
-            # ConfigMap keys must match regex: [-._a-zA-Z0-9]+
-            # Replace path separators with double underscores
-            key = str(relative_path).replace("\\", "__").replace("/", "__")
-            try:
-                # Try reading as text
-                content = file_path.read_text()
-                data[key] = content
-                total_size += len(content)
-            except UnicodeDecodeError:
-                # If binary, base64 encode
-                encoded = base64.b64encode(file_path.read_bytes()).decode()
-                data[key] = encoded
-                total_size += len(encoded)
-
-    logger.info(f"Packaging {len(data)} files ({total_size / 1024:.1f} KB) into ConfigMap")
+    logger.info(f"Packaging {count} files ({total_size / 1024:.1f} KB compressed) into ConfigMap")
 
     # Warn if approaching size limit (3MB for ConfigMaps)
     if total_size > 2_000_000:  # 2MB warning threshold
         logger.warning(
             f"ConfigMap size ({total_size / 1024 / 1024:.1f} MB) is approaching the 3MB limit. "
-            "Consider excluding more files or using a different deployment method."
+            "Consider excluding more files or setting kubernetes.code_bundle_uri "
+            "to ship code through S3."
         )
 
     # Create ConfigMap
     configmap = client.V1ConfigMap(
-        metadata=client.V1ObjectMeta(name=name),
-        data=data
+        metadata=client.V1ObjectMeta(name=name, labels=labels),
+        binary_data={CODE_ARCHIVE_KEY: archive}
     )
 
     try:
@@ -146,19 +203,33 @@ def submit_training_job(
     Returns:
         Job name
     """
-    batch_api, core_api = get_k8s_client(config.kubernetes.context)
-
-    # Create unique job name with timestamp
-    job_name = f"{name}-{int(time.time())}"
-
-    # Create ConfigMap from experiment code
-    configmap_name = f"{job_name}-code"
-    create_configmap_from_path(
-        configmap_name,
-        config.kubernetes.namespace,
-        experiment_path,
-        core_api
-    )
+    clients = get_k8s_client(config.kubernetes.context)
+
+    # Unique job name: timestamp for readability plus a random suffix so
+    # submissions within the same second don't collide. The name is
+    # trimmed so job_name fits the 63 character label value limit.
+    job_name = f"{name[:45]}-{int(time.time())}-{secrets.token_hex(3)}"
+    # Shared by the job, its pods and its ConfigMap so they can be selected together
+    labels = {"app": "ml-training", "job": job_name}
+
+    if config.kubernetes.code_bundle_uri:
+        # Ship code as a tarball through object storage; an init container
+        # unpacks it into a shared emptyDir before the trainer starts
+        bundle_url = upload_code_bundle(
+            experiment_path,
+            config.kubernetes.code_bundle_uri,
+            job_name
+        )
+    else:
+        # Create ConfigMap from experiment code
+        configmap_name = f"{job_name}-code"
+        create_configmap_from_path(
+            configmap_name,
+            config.kubernetes.namespace,
+            experiment_path,
+            clients.core,
+            labels=labels
+        )
 
     # Build environment variables
     env = [
@@ -183,58 +254,69 @@ def submit_training_job(
         resources.requests["nvidia.com/gpu"] = str(gpu)
         resources.limits["nvidia.com/gpu"] = str(gpu)
 
-    # Volume to mount code
-    volume = client.V1Volume(
-        name="code",
-        config_map=client.V1ConfigMapVolumeSource(name=configmap_name)
-    )
-
-    volume_mount = client.V1VolumeMount(
-        name="code",
-        mount_path="/workspace"
-    )
+    init_containers = None
+    if config.kubernetes.code_bundle_uri:
+        volumes = [client.V1Volume(name="work", empty_dir=client.V1EmptyDirVolumeSource())]
+        init_containers = [
+            client.V1Container(
+                name="fetch-code",
+                image=CODE_FETCH_IMAGE,
+                command=["/bin/sh", "-c"],
+                args=['curl -fsSL "$CODE_BUNDLE_URL" | tar -xz -C /work'],
+                env=[client.V1EnvVar(name="CODE_BUNDLE_URL", value=bundle_url)],
+                volume_mounts=[client.V1VolumeMount(name="work", mount_path="/work")]
+            )
+        ]
+        volume_mounts = [client.V1VolumeMount(name="work", mount_path="/work")]
+        # Code is already unpacked by the init container
+        entrypoint_args = []
+    else:
+        # Volume to mount code
+        volumes = [
+            client.V1Volume(
+                name="code",
+                config_map=client.V1ConfigMapVolumeSource(name=configmap_name)
+            )
+        ]
+        volume_mounts = [client.V1VolumeMount(name="code", mount_path="/workspace")]
+        # ConfigMaps are read-only, so the entrypoint unpacks to /work first
+        entrypoint_args = [f"/workspace/{CODE_ARCHIVE_KEY}"]
+
+    if config.kubernetes.pip_cache_pvc:
+        # Reuse downloaded wheels across jobs instead of fetching them every run
+        volumes.append(
+            client.V1Volume(
+                name="pip-cache",
+                persistent_volume_claim=client.V1PersistentVolumeClaimVolumeSource(
+                    claim_name=config.kubernetes.pip_cache_pvc
+                )
+            )
+        )
+        volume_mounts.append(client.V1VolumeMount(name="pip-cache", mount_path=PIP_CACHE_DIR))
+        env.append(client.V1EnvVar(name="PIP_CACHE_DIR", value=PIP_CACHE_DIR))
 
     # Container spec
-    # Note: ConfigMap files are mounted with __ instead of / in filenames
-    # ConfigMaps are read-only, so we need to copy to a writable location first
     container = client.V1Container(
         name="trainer",
         image=image,
-        command=["/bin/bash", "-c"],
-        args=[
-            # Copy from read-only ConfigMap mount to writable location
-            "mkdir -p /work && "
-            "cd /workspace && "
-            # Restore directory structure from flattened ConfigMap keys
-            "for f in *; do "
-            "  if [[ \"$f\" == *__* ]]; then "
-            "    target=\"/work/$(echo \"$f\" | sed 's/__/\\//g')\"; "
-            "    mkdir -p \"$(dirname \"$target\")\"; "
-            "    cp \"$f\" \"$target\"; "
-            "  else "
-            "    cp \"$f\" \"/work/$f\"; "
-            "  fi; "
-            "done && "
-            "cd /work && "
-            "pip install -r requirements.txt && "
-            "python train.py"
-        ],
+        # Unpack, install requirements and exec train.py in one interpreter
+        command=["python", "-c", _ENTRYPOINT_PATH.read_text()],
+        args=entrypoint_args,
         env=env,
         resources=resources,
-        volume_mounts=[volume_mount],
+        volume_mounts=volume_mounts,
         working_dir="/work"
     )
 
     # Pod template
     template = client.V1PodTemplateSpec(
-        metadata=client.V1ObjectMeta(
-            labels={"app": "ml-training", "job": job_name}
-        ),
+        metadata=client.V1ObjectMeta(labels=labels),
         spec=client.V1PodSpec(
             service_account_name="training-sa",  # Enable IRSA for S3 access
             restart_policy="Never",
+            init_containers=init_containers,
             containers=[container],
-            volumes=[volume]
+            volumes=volumes
         )
     )
 
@@ -249,12 +331,12 @@ def submit_training_job(
     job = client.V1Job(
         api_version="batch/v1",
         kind="Job",
-        metadata=client.V1ObjectMeta(name=job_name),
+        metadata=client.V1ObjectMeta(name=job_name, labels=labels),
         spec=job_spec
     )
 
     try:
-        batch_api.create_namespaced_job(config.kubernetes.namespace, job)
+        clients.batch.create_namespaced_job(config.kubernetes.namespace, job)
         logger.info(f"Created job: {job_name}")
         return job_name
     except ApiException as e:
@@ -265,74 +347,178 @@ def submit_training_job(
 def wait_for_job(job_name: str, namespace: str, timeout: int = 600):
     """Wait for a job to start running.
 
+    Uses a watch on the job instead of polling, so a status change is seen
+    as soon as the API server reports it.
+
     Args:
         job_name: Job name
         namespace: Kubernetes namespace
         timeout: Timeout in seconds
     """
-    batch_api, core_api = get_k8s_client()
+    clients = get_k8s_client()
 
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            job = batch_api.read_namespaced_job(job_name, namespace)
+    deadline = time.time() + timeout
+    resource_version = None
+    w = watch.Watch()
 
-            # Check if job has started
-            if job.status.active and job.status.active > 0:
-                logger.info(f"Job {job_name} is running")
-                return
+    while True:
+        remaining = int(deadline - time.time())
+        if remaining <= 0:
+            break
 
-            # Check if job failed
-            if job.status.failed and job.status.failed > 0:
-                logger.error(f"Job {job_name} failed")
-                raise RuntimeError(f"Job {job_name} failed")
+        kwargs = {
+            "namespace": namespace,
+            "field_selector": f"metadata.name={job_name}",
+            "timeout_seconds": remaining,
+        }
+        if resource_version:
+            kwargs["resource_version"] = resource_version
 
-            time.sleep(2)
+        try:
+            for event in w.stream(clients.batch.list_namespaced_job, **kwargs):
+                job = event["object"]
+                resource_version = job.metadata.resource_version
+
+                # Check if job has started (or already finished between events)
+                if job.status.active or job.status.succeeded:
+                    w.stop()
+                    logger.info(f"Job {job_name} is running")
+                    return
+
+                # Check if job failed
+                if job.status.failed and job.status.failed > 0:
+                    w.stop()
+                    logger.error(f"Job {job_name} failed")
+                    raise RuntimeError(f"Job {job_name} failed")
         except ApiException as e:
+            if e.status == 410:  # resourceVersion too old, restart from current state
+                resource_version = None
+                continue
             logger.error(f"Error checking job status: {e}")
             raise
 
     raise TimeoutError(f"Job {job_name} did not start within {timeout} seconds")
 
 
-def stream_job_logs(job_name: str, namespace: str):
-    """Stream logs from a job.
+def _write_log_stream(logs):
+    """Copy a streaming log response to stdout.
+
+    Raw bytes are passed through in large chunks instead of being decoded
+    and printed line by line.
+
+    Args:
+        logs: Log response returned with _preload_content=False
+    """
+    out = sys.stdout.buffer
+    for chunk in logs.stream(amt=65536):
+        out.write(chunk)
+        out.flush()
+
+
+def _wait_for_job_pod(
+    core_api: client.CoreV1Api,
+    job_name: str,
+    namespace: str,
+    timeout: int = 120
+) -> Optional[str]:
+    """Wait for a job's pod to reach a phase that has logs.
 
     Args:
+        core_api: Kubernetes Core API client
         job_name: Job name
         namespace: Kubernetes namespace
+        timeout: Maximum seconds to wait
+
+    Returns:
+        Pod name, or None if no pod started within the timeout
     """
-    batch_api, core_api = get_k8s_client()
+    w = watch.Watch()
+    for event in w.stream(
+        core_api.list_namespaced_pod,
+        namespace=namespace,
+        label_selector=f"job-name={job_name}",
+        timeout_seconds=timeout
+    ):
+        pod = event["object"]
+        if pod.status.phase in ("Running", "Succeeded", "Failed"):
+            w.stop()
+            return pod.metadata.name
+    return None
+
+
+def stream_job_logs(job_name: str, namespace: str, tail_lines: Optional[int] = 10000):
+    """Stream logs from a job.
 
-    # Find pod for job
-    pods = core_api.list_namespaced_pod(
-        namespace,
-        label_selector=f"job-name={job_name}"
-    )
+    Args:
+        job_name: Job name
+        namespace: Kubernetes namespace
+        tail_lines: Number of existing lines to show before following
+            (None for the full log)
+    """
+    clients = get_k8s_client()
 
-    if not pods.items:
+    pod_name = _wait_for_job_pod(clients.core, job_name, namespace)
+    if pod_name is None:
         logger.error(f"No pods found for job {job_name}")
         return
 
-    pod_name = pods.items[0].metadata.name
-
     try:
-        # Stream logs
-        logs = core_api.read_namespaced_pod_log(
+        # The existing tail arrives in bulk on the same request, then
+        # new output follows without a gap between the two
+        logs = clients.core.read_namespaced_pod_log(
             pod_name,
             namespace,
             follow=True,
+            tail_lines=tail_lines,
             _preload_content=False
         )
 
-        for line in logs.stream():
-            print(line.decode('utf-8'), end='')
+        _write_log_stream(logs)
 
     except ApiException as e:
         logger.error(f"Error streaming logs: {e}")
         raise
 
 
+# Page size for LIST calls, keeping individual responses small
+_LIST_PAGE_SIZE = 500
+
+
+def _list_all(list_func, namespace: str, **kwargs) -> List:
+    """List a namespaced resource page by page.
+
+    Args:
+        list_func: Kubernetes client list function (e.g. list_namespaced_job)
+        namespace: Kubernetes namespace
+        **kwargs: Extra list arguments such as label_selector
+
+    Returns:
+        All items across pages
+    """
+    items = []
+    token = None
+    while True:
+        if token:
+            kwargs["_continue"] = token
+        resp = list_func(namespace, limit=_LIST_PAGE_SIZE, **kwargs)
+        items.extend(resp.items)
+        token = resp.metadata._continue
+        if not token:
+            return items
+
+
+# (seconds, suffix) pairs for formatting ages, largest unit first
+_AGE_UNITS = ((86400, "d"), (3600, "h"), (60, "m"), (1, "s"))
+
+
+def _humanize_age(seconds: int) -> str:
+    """Format an age in seconds as a short string like "5m" or "2d"."""
+    for unit_seconds, suffix in _AGE_UNITS:
+        if seconds >= unit_seconds:
+            return f"{seconds // unit_seconds}{suffix}"
+    return "0s"
+
+
 def list_jobs(namespace: str, status_filter: str = "all") -> List[Dict]:
     """List ML training jobs.
 
@@ -343,49 +529,40 @@ def list_jobs(namespace: str, status_filter: str = "all") -> List[Dict]:
     Returns:
         List of job information dictionaries
     """
-    batch_api, _ = get_k8s_client()
+    clients = get_k8s_client()
 
     try:
-        jobs = batch_api.list_namespaced_job(
+        selectors = {}
+        if status_filter == "completed":
+            # status.successful is the only Job status field the API server
+            # can filter on, so only the matching jobs are transferred
+            selectors["field_selector"] = "status.successful!=0"
+        jobs = _list_all(
+            clients.batch.list_namespaced_job,
             namespace,
-            label_selector="app=ml-training"
+            label_selector="app=ml-training",
+            **selectors
         )
 
+        now = time.time()
         result = []
-        for job in jobs.items:
-            status = "Unknown"
-            if job.status.active and job.status.active > 0:
-                status = "Running"
-            elif job.status.succeeded and job.status.succeeded > 0:
-                status = "Completed"
-            elif job.status.failed and job.status.failed > 0:
-                status = "Failed"
+        for job in jobs:
+            job_status = job.status
+            status = (
+                "Running" if job_status.active
+                else "Completed" if job_status.succeeded
+                else "Failed" if job_status.failed
+                else "Unknown"
+            )
 
             # Apply filter
-            if status_filter != "all":
-                if status_filter == "running" and status != "Running":
-                    continue
-                if status_filter == "completed" and status != "Completed":
-                    continue
-                if status_filter == "failed" and status != "Failed":
-                    continue
-
-            # Calculate age
-            created = job.metadata.creation_timestamp
-            age = time.time() - created.timestamp()
-            if age < 60:
-                age_str = f"{int(age)}s"
-            elif age < 3600:
-                age_str = f"{int(age / 60)}m"
-            elif age < 86400:
-                age_str = f"{int(age / 3600)}h"
-            else:
-                age_str = f"{int(age / 86400)}d"
+            if status_filter != "all" and status.lower() != status_filter:
+                continue
 
             result.append({
                 "name": job.metadata.name,
                 "status": status,
-                "age": age_str,
+                "age": _humanize_age(int(now - job.metadata.creation_timestamp.timestamp())),
                 "completions": job.status.succeeded or 0
             })
 
@@ -403,24 +580,28 @@ def delete_job(job_name: str, namespace: str):
         job_name: Job name
         namespace: Kubernetes namespace
     """
-    batch_api, core_api = get_k8s_client()
+    clients = get_k8s_client()
 
     try:
-        # Delete job
-        batch_api.delete_namespaced_job(
+        # Delete by name so a missing job raises a 404 instead of silently
+        # matching nothing
+        clients.batch.delete_namespaced_job(
             job_name,
             namespace,
             propagation_policy="Foreground"
         )
         logger.info(f"Deleted job: {job_name}")
 
-        # Delete associated ConfigMap
+        # Delete associated ConfigMap (also covers ConfigMaps created before
+        # jobs were labelled)
         configmap_name = f"{job_name}-code"
         try:
-            core_api.delete_namespaced_config_map(configmap_name, namespace)
+            clients.core.delete_namespaced_config_map(configmap_name, namespace)
             logger.info(f"Deleted ConfigMap: {configmap_name}")
-        except ApiException:
-            pass  # ConfigMap might not exist
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            # Jobs using code_bundle_uri have no ConfigMap
 
     except ApiException as e:
         logger.error(f"Error deleting job: {e}")
@@ -437,19 +618,22 @@ def get_job_status(job_name: str, namespace: str) -> Dict:
     Returns:
         Dictionary with job status information
     """
-    batch_api, core_api = get_k8s_client()
+    clients = get_k8s_client()
 
     try:
-        job = batch_api.read_namespaced_job(job_name, namespace)
-
-        # Get pod info
-        pods = core_api.list_namespaced_pod(
-            namespace,
-            label_selector=f"job-name={job_name}"
-        )
+        # The job read and its pod list are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            job_future = executor.submit(clients.batch.read_namespaced_job, job_name, namespace)
+            pods_future = executor.submit(
+                _list_all,
+                clients.core.list_namespaced_pod,
+                namespace,
+                label_selector=f"job-name={job_name}"
+            )
+            job, pods = job_future.result(), pods_future.result()
 
         pod_status = []
-        for pod in pods.items:
+        for pod in pods:
             pod_status.append({
                 "name": pod.metadata.name,
                 "phase": pod.status.phase,
@@ -500,18 +684,14 @@ def deploy_model(
         port: Service port
         env: Additional environment variables
     """
-    _, core_api = get_k8s_client()
-    apps_api = client.AppsV1Api()
-
-    env = env or {}
+    clients = get_k8s_client()
 
-    # Build environment variables
+    # Build environment variables; user values override the defaults
+    # without leaving duplicate names in the container spec
     env_vars = [
-        client.V1EnvVar(name="MODEL_URI", value=model_uri),
-        client.V1EnvVar(name="PORT", value=str(port)),
+        client.V1EnvVar(name=key, value=value)
+        for key, value in {"MODEL_URI": model_uri, "PORT": str(port), **(env or {})}.items()
     ]
-    for key, value in env.items():
-        env_vars.append(client.V1EnvVar(name=key, value=value))
 
     # Resource requirements
     resources = client.V1ResourceRequirements(
@@ -578,11 +758,11 @@ def deploy_model(
     )
 
     try:
-        apps_api.create_namespaced_deployment(namespace, deployment)
+        clients.apps.create_namespaced_deployment(namespace, deployment)
         logger.info(f"Created deployment: {model_name}")
     except ApiException as e:
         if e.status == 409:  # Already exists
-            apps_api.replace_namespaced_deployment(model_name, namespace, deployment)
+            clients.apps.replace_namespaced_deployment(model_name, namespace, deployment)
             logger.info(f"Updated deployment: {model_name}")
         else:
             raise
@@ -604,11 +784,11 @@ def deploy_model(
     )
 
     try:
-        core_api.create_namespaced_service(namespace, service)
+        clients.core.create_namespaced_service(namespace, service)
         logger.info(f"Created service: {model_name}")
     except ApiException as e:
         if e.status == 409:  # Already exists
-            core_api.replace_namespaced_service(model_name, namespace, service)
+            clients.core.replace_namespaced_service(model_name, namespace, service)
             logger.info(f"Updated service: {model_name}")
         else:
             raise
@@ -624,54 +804,54 @@ def list_model_deployments(namespace: str, status_filter: str = "all") -> List[D
     Returns:
         List of deployment information dictionaries
     """
-    apps_api = client.AppsV1Api()
-    _, core_api = get_k8s_client()
+    clients = get_k8s_client()
 
     try:
-        deployments = apps_api.list_namespaced_deployment(
-            namespace,
-            label_selector="type=model-server"
-        )
+        # Model services carry the same label as their deployments, so one
+        # paginated LIST (run alongside the deployment LIST) replaces a read
+        # per model
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            deployments_future = executor.submit(
+                _list_all,
+                clients.apps.list_namespaced_deployment,
+                namespace,
+                label_selector="type=model-server"
+            )
+            services_future = executor.submit(
+                _list_all,
+                clients.core.list_namespaced_service,
+                namespace,
+                label_selector="type=model-server"
+            )
+            deployments = deployments_future.result()
+            services = {svc.metadata.name: svc for svc in services_future.result()}
 
+        filter_available = status_filter != "all"
+        want_available = status_filter == "available"
+        now = time.time()
         result = []
-        for dep in deployments.items:
+        for dep in deployments:
             replicas = dep.spec.replicas or 0
             ready_replicas = dep.status.ready_replicas or 0
             available = ready_replicas == replicas and replicas > 0
 
             # Apply filter
-            if status_filter == "available" and not available:
-                continue
-            if status_filter == "unavailable" and available:
+            if filter_available and available != want_available:
                 continue
 
             # Get service URL
-            try:
-                service = core_api.read_namespaced_service(dep.metadata.name, namespace)
-                cluster_ip = service.spec.cluster_ip
-                port = service.spec.ports[0].port
-                service_url = f"http://{cluster_ip}:{port}"
-            except ApiException:
-                service_url = None
-
-            # Calculate age
-            created = dep.metadata.creation_timestamp
-            age = time.time() - created.timestamp()
-            if age < 60:
-                age_str = f"{int(age)}s"
-            elif age < 3600:
-                age_str = f"{int(age / 60)}m"
-            elif age < 86400:
-                age_str = f"{int(age / 3600)}h"
+            service = services.get(dep.metadata.name)
+            if service is not None:
+                service_url = f"http://{service.spec.cluster_ip}:{service.spec.ports[0].port}"
             else:
-                age_str = f"{int(age / 86400)}d"
+                service_url = None
 
             result.append({
                 "name": dep.metadata.name,
                 "replicas": replicas,
                 "ready_replicas": ready_replicas,
                 "available": available,
-                "age": age_str,
+                "age": _humanize_age(int(now - dep.metadata.creation_timestamp.timestamp())),
                 "service_url": service_url
             })
 
@@ -689,12 +869,11 @@ def delete_model_deployment(model_name: str, namespace: str):
         model_name: Model deployment name
         namespace: Kubernetes namespace
     """
-    apps_api = client.AppsV1Api()
-    _, core_api = get_k8s_client()
+    clients = get_k8s_client()
 
     try:
         # Delete deployment
-        apps_api.delete_namespaced_deployment(
+        clients.apps.delete_namespaced_deployment(
             model_name,
             namespace,
             propagation_policy="Foreground"
@@ -703,7 +882,7 @@ def delete_model_deployment(model_name: str, namespace: str):
 
         # Delete service
         try:
-            core_api.delete_namespaced_service(model_name, namespace)
+            clients.core.delete_namespaced_service(model_name, namespace)
             logger.info(f"Deleted service: {model_name}")
         except ApiException:
             pass  # Service might not exist
@@ -723,10 +902,10 @@ def get_model_service_url(model_name: str, namespace: str) -> Optional[str]:
     Returns:
         Service URL or None if not found
     """
-    _, core_api = get_k8s_client()
+    clients = get_k8s_client()
 
     try:
-        service = core_api.read_namespaced_service(model_name, namespace)
+        service = clients.core.read_namespaced_service(model_name, namespace)
         cluster_ip = service.spec.cluster_ip
         port = service.spec.ports[0].port
         return f"http://{cluster_ip}:{port}"
@@ -748,11 +927,11 @@ def stream_deployment_logs(
         follow: Whether to follow log output
         tail_lines: Number of lines to show from the end
     """
-    _, core_api = get_k8s_client()
+    clients = get_k8s_client()
 
     try:
         # Find pods for deployment
-        pods = core_api.list_namespaced_pod(
+        pods = clients.core.list_namespaced_pod(
             namespace,
             label_selector=f"app={deployment_name}"
         )
@@ -765,17 +944,16 @@ def stream_deployment_logs(
         pod_name = pods.items[0].metadata.name
 
         if follow:
-            logs = core_api.read_namespaced_pod_log(
+            logs = clients.core.read_namespaced_pod_log(
                 pod_name,
                 namespace,
                 follow=True,
                 tail_lines=tail_lines,
                 _preload_content=False
             )
-            for line in logs.stream():
-                print(line.decode('utf-8'), end='')
+            _write_log_stream(logs)
         else:
-            logs = core_api.read_namespaced_pod_log(
+            logs = clients.core.read_namespaced_pod_log(
                 pod_name,
                 namespace,
                 tail_lines=tail_lines
@@ -1,10 +1,53 @@
 """Logging utilities using Rich console."""
 
+import functools
 import logging
+import os
+from typing import Optional
 from rich.console import Console
 from rich.logging import RichHandler
 
-console = Console()
+
+@functools.cache
+def console() -> Console:
+    """
+    Get the shared Rich console.
+
+    Created on first use: loggers only request it when they emit a record,
+    so importing a command module does not build it.
+
+    Returns:
+        Console instance shared by all commands
+    """
+    return Console(highlight=False)
+
+
+class _DeferredRichHandler(logging.Handler):
+    """Logging handler that builds its RichHandler on the first record.
+
+    Every module sets up its logger at import time, so creating the
+    RichHandler (and with it the console) eagerly would defeat the lazy
+    console.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.handler: Optional[RichHandler] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Create the RichHandler if needed and pass the record to it."""
+        if self.handler is None:
+            # Rendering every frame's locals can be very slow when large arrays
+            # or dataframes are in scope, so only do it when debugging (MLP_DEBUG=1)
+            self.handler = RichHandler(
+                console=console(),
+                rich_tracebacks=True,
+                tracebacks_show_locals=os.environ.get("MLP_DEBUG") == "1",
+                markup=False,
+                show_path=False
+            )
+            self.handler.setFormatter(logging.Formatter("%(message)s"))
+        self.handler.emit(record)
 
 
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
@@ -23,13 +66,7 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
 
     # Add Rich handler if not already present
     if not logger.handlers:
-        handler = RichHandler(
-            console=console,
-            rich_tracebacks=True,
-            tracebacks_show_locals=True
-        )
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        logger.addHandler(handler)
+        logger.addHandler(_DeferredRichHandler())
 
     return logger
 
@@ -1,21 +1,72 @@
 """Template scaffolding utilities for ML projects."""
 
+import functools
 import shutil
 from pathlib import Path
 from typing import Dict, Any
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
+from mlp.utils.cache import get_cache_dir
 from mlp.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+# Metadata for each scaffold template, in display order
+_TEMPLATES = {
+    "simple": {
+        "name": "Simple",
+        "description": "Basic Python ML project with scikit-learn",
+        "dependencies": ["scikit-learn", "pandas", "numpy"],
+        "use_case": "Traditional ML algorithms, quick experiments",
+    },
+    "pytorch": {
+        "name": "PyTorch",
+        "description": "Deep learning project with PyTorch",
+        "dependencies": ["torch", "torchvision", "pytorch-lightning"],
+        "use_case": "Neural networks, computer vision, NLP",
+    },
+    "tensorflow": {
+        "name": "TensorFlow",
+        "description": "Deep learning project with TensorFlow/Keras",
+        "dependencies": ["tensorflow", "keras"],
+        "use_case": "Neural networks, production deployment",
+    },
+    "sklearn": {
+        "name": "Scikit-learn",
+        "description": "Comprehensive ML project with scikit-learn",
+        "dependencies": ["scikit-learn", "pandas", "numpy", "matplotlib", "seaborn"],
+        "use_case": "Traditional ML with full data science stack",
+    },
+}
+
+
+@functools.lru_cache(maxsize=1)
 def get_template_engine():
-    """Get configured Jinja2 environment."""
+    """Get configured Jinja2 environment.
+
+    The environment is shared within a process so parsed templates are
+    reused, and compiled templates are kept in ~/.mlp/cache/jinja so later
+    invocations skip the parse and compile step.
+    """
+    bytecode_cache = None
+    cache_dir = get_cache_dir() / "jinja"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+    except OSError as e:
+        logger.debug(f"Template bytecode cache disabled: {e}")
+
+    # Templates render Python/YAML/Markdown, never HTML, so nothing is escaped.
+    # Packaged templates do not change while the CLI runs: skip the mtime
+    # check on every get_template() and never evict loaded templates.
     return Environment(
         loader=PackageLoader("mlp", "templates"),
-        autoescape=select_autoescape(),
+        autoescape=False,
         trim_blocks=True,
         lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=bytecode_cache,
     )
 
 
@@ -38,7 +89,7 @@ def scaffold_project(
         ValueError: If template type is invalid
     """
     # Validate template type
-    valid_templates = ["simple", "pytorch", "tensorflow", "sklearn"]
+    valid_templates = list(_TEMPLATES)
     if template not in valid_templates:
         raise ValueError(f"Invalid template: {template}. Choose from {valid_templates}")
 
@@ -96,35 +147,30 @@ def scaffold_project(
         (dir_path / ".gitkeep").touch()
         logger.info(f"Created directory: {dir_name}")
 
-    # Initialize DVC if available
-    try:
-        import subprocess
-        result = subprocess.run(
-            ["dvc", "init"],
-            cwd=target_path,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            logger.info("Initialized DVC repository")
-    except Exception as e:
-        logger.debug(f"DVC initialization skipped: {e}")
-
-    # Initialize git if available
-    try:
-        import subprocess
-        result = subprocess.run(
-            ["git", "init"],
-            cwd=target_path,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            logger.info("Initialized git repository")
-    except Exception as e:
-        logger.debug(f"Git initialization skipped: {e}")
+    # Initialize git, then DVC (dvc init requires an existing git repository).
+    # These run after the templates are written because dvc init only
+    # creates .dvcignore when the project does not already have one.
+    import subprocess
+    for command, message in (
+        (["git", "init"], "Initialized git repository"),
+        (["dvc", "init"], "Initialized DVC repository"),
+    ):
+        # Probing PATH is much cheaper than spawning a missing binary
+        if shutil.which(command[0]) is None:
+            logger.debug(f"{command[0]} initialization skipped: {command[0]} not found")
+            continue
+        try:
+            result = subprocess.run(
+                command,
+                cwd=target_path,
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            if result.returncode == 0:
+                logger.info(message)
+        except Exception as e:
+            logger.debug(f"{command[0]} initialization skipped: {e}")
 
 
 def get_template_info(template: str) -> Dict[str, Any]:
@@ -136,34 +182,7 @@ def get_template_info(template: str) -> Dict[str, Any]:
     Returns:
         Dictionary with template metadata
     """
-    templates = {
-        "simple": {
-            "name": "Simple",
-            "description": "Basic Python ML project with scikit-learn",
-            "dependencies": ["scikit-learn", "pandas", "numpy"],
-            "use_case": "Traditional ML algorithms, quick experiments",
-        },
-        "pytorch": {
-            "name": "PyTorch",
-            "description": "Deep learning project with PyTorch",
-            "dependencies": ["torch", "torchvision", "pytorch-lightning"],
-            "use_case": "Neural networks, computer vision, NLP",
-        },
-        "tensorflow": {
-            "name": "TensorFlow",
-            "description": "Deep learning project with TensorFlow/Keras",
-            "dependencies": ["tensorflow", "keras"],
-            "use_case": "Neural networks, production deployment",
-        },
-        "sklearn": {
-            "name": "Scikit-learn",
-            "description": "Comprehensive ML project with scikit-learn",
-            "dependencies": ["scikit-learn", "pandas", "numpy", "matplotlib", "seaborn"],
-            "use_case": "Traditional ML with full data science stack",
-        },
-    }
-
-    return templates.get(template, {})
+    return _TEMPLATES.get(template, {}).copy()
 
 
 def list_templates() -> Dict[str, Dict[str, Any]]:
@@ -172,9 +191,4 @@ def list_templates() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping template names to their metadata
     """
-    return {
-        "simple": get_template_info("simple"),
-        "pytorch": get_template_info("pytorch"),
-        "tensorflow": get_template_info("tensorflow"),
-        "sklearn": get_template_info("sklearn"),
-    }
+    return {name: info.copy() for name, info in _TEMPLATES.items()}
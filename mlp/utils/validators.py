@@ -1,9 +1,29 @@
 """Input validation utilities."""
 
+import os
 import re
-from pathlib import Path
 from typing import Optional
 
+# Must be alphanumeric with hyphens/underscores, 3-50 chars
+_NAME_RE = re.compile(r'[a-z0-9][a-z0-9-_]{2,49}')
+# Bucket/container names for storage URIs; the literal scheme prefix is
+# checked with str.startswith first so most non-matches never reach the regex
+_S3_BUCKET_RE = re.compile(r'[a-z0-9][a-z0-9.-]{1,61}[a-z0-9]')
+_AZURE_CONTAINER_RE = re.compile(r'[a-z0-9][a-z0-9-]{1,61}[a-z0-9]')
+# Must be lowercase alphanumeric with hyphens (length is checked separately)
+_K8S_NAMESPACE_RE = re.compile(r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?$')
+_URL_RE = re.compile(r'[^\s/$.?#].[^\s]*$')
+
+
+def _match_storage_uri(pattern: re.Pattern, uri: str, start: int) -> bool:
+    """Match the bucket/container between the scheme and the first '/'.
+
+    The object key after the '/' is not validated, so its length does not
+    affect the cost of the check.
+    """
+    end = uri.find("/", start)
+    return pattern.fullmatch(uri, start, len(uri) if end == -1 else end) is not None
+
 
 def validate_name(name: str) -> bool:
     """
@@ -15,9 +35,7 @@ def validate_name(name: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    # Must be alphanumeric with hyphens/underscores, 3-50 chars
-    pattern = r'^[a-z0-9][a-z0-9-_]{2,49}$'
-    return bool(re.match(pattern, name))
+    return _NAME_RE.fullmatch(name) is not None
 
 
 def validate_s3_uri(uri: str) -> bool:
@@ -30,8 +48,7 @@ def validate_s3_uri(uri: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^s3://[a-z0-9][a-z0-9.-]{1,61}[a-z0-9](/.*)?$'
-    return bool(re.match(pattern, uri))
+    return uri.startswith("s3://") and _match_storage_uri(_S3_BUCKET_RE, uri, len("s3://"))
 
 
 def validate_azure_uri(uri: str) -> bool:
@@ -44,8 +61,10 @@ def validate_azure_uri(uri: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^azure://[a-z0-9][a-z0-9-]{1,61}[a-z0-9](/.*)?$'
-    return bool(re.match(pattern, uri))
+    return (
+        uri.startswith("azure://")
+        and _match_storage_uri(_AZURE_CONTAINER_RE, uri, len("azure://"))
+    )
 
 
 def validate_k8s_context(context: str) -> bool:
@@ -72,9 +91,8 @@ def validate_k8s_namespace(namespace: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    # Must be lowercase alphanumeric with hyphens, max 63 chars
-    pattern = r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?$'
-    return bool(re.match(pattern, namespace)) and len(namespace) <= 63
+    # Max 63 chars
+    return len(namespace) <= 63 and _K8S_NAMESPACE_RE.match(namespace) is not None
 
 
 def validate_path(path: str, must_exist: bool = False) -> bool:
@@ -88,13 +106,11 @@ def validate_path(path: str, must_exist: bool = False) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    try:
-        p = Path(path)
-        if must_exist:
-            return p.exists()
-        return True
-    except (ValueError, OSError):
-        return False
+    # os.path.exists is a single stat() and already returns False for
+    # unrepresentable paths, so no Path object is needed
+    if must_exist:
+        return os.path.exists(path)
+    return isinstance(path, (str, bytes, os.PathLike))
 
 
 def validate_url(url: str) -> bool:
@@ -107,5 +123,8 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-    return bool(re.match(pattern, url))
+    if url.startswith("https://"):
+        return _URL_RE.match(url, len("https://")) is not None
+    if url.startswith("http://"):
+        return _URL_RE.match(url, len("http://")) is not None
+    return False
@@ -1,3 +1,4 @@
+from pathlib import Path
 from setuptools import setup, find_packages
 
 setup(
@@ -14,16 +15,15 @@ setup(
         "boto3>=1.28.0",       # AWS SDK
         "requests>=2.31.0",
         "jinja2>=3.1.0",       # For templates
-        "pydantic>=2.0.0",     # Config validation
     ],
     entry_points={
         "console_scripts": [
-            "mlp=mlp.cli:cli",
+            "mlp=mlp.__main__:main",
         ],
     },
     python_requires=">=3.10",
     author="Your Name",
     description="ML Platform CLI - Simplify your MLOps workflows",
-    long_description=open("README.md").read(),
+    long_description=Path(__file__).with_name("README.md").read_text(encoding="utf-8"),
     long_description_content_type="text/markdown",
 )
@@ -88,8 +88,9 @@ output "mlp_config_snippet" {
   description = "Configuration snippet for ~/.mlp/config.yaml"
   value = yamlencode({
     kubernetes = {
-      context   = module.eks.cluster_arn
-      namespace = var.k8s_namespace
+      context         = module.eks.cluster_arn
+      namespace       = var.k8s_namespace
+      code_bundle_uri = "s3://${aws_s3_bucket.mlflow_artifacts.id}/code-bundles"
     }
     mlflow = {
       tracking_uri  = var.domain_name != "" ? "https://${var.mlflow_subdomain}.${var.domain_name}" : "http://${try(kubernetes_service.mlflow.status[0].load_balancer[0].ingress[0].hostname, "localhost")}:5000"
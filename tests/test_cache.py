@@ -0,0 +1,49 @@
+"""Tests for the on-disk JSON cache."""
+
+import os
+import time
+import pytest
+from mlp.utils.cache import read_json_cache, write_json_cache
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Point the cache at a temporary home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+def test_cache_roundtrip(home):
+    """Test that written data can be read back."""
+    write_json_cache("test.json", {"a": 1})
+    assert (home / ".mlp" / "cache" / "test.json").exists()
+    assert read_json_cache("test.json") == {"a": 1}
+
+
+def test_cache_missing(home):
+    """Test that a missing cache returns None."""
+    assert read_json_cache("missing.json") is None
+
+
+def test_cache_expired(home):
+    """Test that entries older than the TTL are ignored."""
+    write_json_cache("test.json", {"a": 1})
+    cache_path = home / ".mlp" / "cache" / "test.json"
+    old = time.time() - 120
+    os.utime(cache_path, (old, old))
+
+    assert read_json_cache("test.json", ttl=60) is None
+    assert read_json_cache("test.json", ttl=3600) == {"a": 1}
+
+
+def test_cache_invalidated_by_newer_file(home):
+    """Test that the cache is stale when a dependency changes."""
+    write_json_cache("test.json", {"a": 1})
+    cache_path = home / ".mlp" / "cache" / "test.json"
+    old = time.time() - 120
+    os.utime(cache_path, (old, old))
+
+    state = home / "terraform.tfstate"
+    state.write_text("{}")
+    assert read_json_cache("test.json", newer_than=state) is None
+    assert read_json_cache("test.json", newer_than=home / "absent") == {"a": 1}
@@ -0,0 +1,34 @@
+"""Tests for the top-level CLI group."""
+
+import subprocess
+import sys
+from click.testing import CliRunner
+from mlp.cli import cli
+
+
+def test_help_lists_commands():
+    """Test that lazily registered commands appear in help."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--help"])
+    assert result.exit_code == 0
+    for name in ("init", "experiment", "model"):
+        assert name in result.output
+
+
+def test_unknown_command():
+    """Test that unknown commands are rejected."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["does-not-exist"])
+    assert result.exit_code != 0
+
+
+def test_import_does_not_load_commands():
+    """Test that importing the CLI does not import command modules."""
+    code = (
+        "import sys, mlp.cli; "
+        "print(any(m.startswith('mlp.commands.') for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,48 @@
+"""Tests for the optional CLI daemon."""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+import pytest
+from mlp import daemon
+
+
+def test_should_forward():
+    """Test that interactive and streaming commands stay local."""
+    assert daemon.should_forward(["experiment", "list"])
+    assert daemon.should_forward(["--help"])
+    assert not daemon.should_forward(["init"])
+    assert not daemon.should_forward(["experiment", "run", "./my-model"])
+    assert not daemon.should_forward(["model", "logs", "my-model", "-f"])
+    assert not daemon.should_forward(["daemon", "stop"])
+
+
+def test_forward_without_daemon(tmp_path, monkeypatch):
+    """Test that forwarding falls back when no daemon is running."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert daemon.forward(["experiment", "list"]) is None
+
+
+@pytest.mark.skipif(not daemon.is_supported(), reason="requires Unix sockets and fork")
+def test_forward_through_daemon(tmp_path, monkeypatch, capsys):
+    """Test running a command through a live daemon."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "mlp.daemon"],
+        env={**os.environ, "HOME": str(tmp_path)},
+    )
+    try:
+        deadline = time.time() + 10
+        while not daemon.ping() and time.time() < deadline:
+            time.sleep(0.05)
+
+        assert daemon.forward(["--version"]) == 0
+        assert "0.1.0" in capsys.readouterr().out
+        assert daemon.forward(["no-such-command"]) == 2
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=10)
+
+    assert not daemon.get_socket_path().exists()
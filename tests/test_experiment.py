@@ -6,13 +6,29 @@ import shutil
 from pathlib import Path
 from click.testing import CliRunner
 from mlp.cli import cli
+from mlp.commands.experiment import (
+    detect_framework,
+    get_training_images,
+    load_experiment_config,
+    load_terraform_outputs
+)
 from mlp.utils.templates import (
+    get_template_engine,
     scaffold_project,
     get_template_info,
     list_templates
 )
 
 
+@pytest.fixture(autouse=True)
+def template_cache_home(tmp_path, monkeypatch):
+    """Keep compiled templates out of the real home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    get_template_engine.cache_clear()
+    yield
+    get_template_engine.cache_clear()
+
+
 class TestTemplateScaffolding:
     """Test template scaffolding functionality."""
 
@@ -95,6 +111,38 @@ class TestTemplateScaffolding:
             # New files should exist
             assert (target_path / "train.py").exists()
 
+    def test_git_initialized_before_dvc(self, tmp_path, monkeypatch):
+        """Test that dvc init runs inside an already initialized git repo."""
+        import subprocess
+        from types import SimpleNamespace
+
+        commands = []
+        monkeypatch.setattr(
+            subprocess, "run",
+            lambda cmd, **kw: commands.append(cmd) or SimpleNamespace(returncode=0)
+        )
+        monkeypatch.setattr(shutil, "which", lambda name: f"/usr/bin/{name}")
+
+        scaffold_project("ordered", tmp_path / "ordered", template="simple")
+
+        assert commands == [["git", "init"], ["dvc", "init"]]
+
+    def test_missing_binaries_not_spawned(self, tmp_path, monkeypatch):
+        """Test that git/dvc init are skipped when the binary is not on PATH."""
+        import subprocess
+        from types import SimpleNamespace
+
+        commands = []
+        monkeypatch.setattr(
+            subprocess, "run",
+            lambda cmd, **kw: commands.append(cmd) or SimpleNamespace(returncode=0)
+        )
+        monkeypatch.setattr(shutil, "which", lambda name: "/usr/bin/git" if name == "git" else None)
+
+        scaffold_project("nodvc", tmp_path / "nodvc", template="simple")
+
+        assert commands == [["git", "init"]]
+
     def test_invalid_template(self):
         """Test that invalid template raises error."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -119,6 +167,18 @@ class TestTemplateScaffolding:
         assert "sklearn" in templates
 
 
+class TestTemplateEngine:
+    """Test Jinja2 environment caching."""
+
+    def test_engine_shared_and_bytecode_cached(self, tmp_path):
+        """Test that one environment is reused and compiled templates are stored."""
+        assert get_template_engine() is get_template_engine()
+
+        scaffold_project("cached", tmp_path / "cached", template="simple")
+
+        assert any((tmp_path / "home" / ".mlp" / "cache" / "jinja").iterdir())
+
+
 class TestExperimentCommand:
     """Test experiment CLI commands."""
 
@@ -186,6 +246,105 @@ class TestExperimentCommand:
         assert "list" in result.output.lower()
 
 
+class TestDetectFramework:
+    """Test ML framework auto-detection."""
+
+    @pytest.fixture(autouse=True)
+    def home(self, tmp_path, monkeypatch):
+        """Keep the framework cache out of the real home directory."""
+        home = tmp_path / "home"
+        monkeypatch.setenv("HOME", str(home))
+        return home
+
+    def test_framework_from_experiment_yaml(self, tmp_path):
+        """Test reading a top-level framework key."""
+        (tmp_path / "experiment.yaml").write_text("framework: pytorch  # override\nname: x\n")
+        assert detect_framework(tmp_path) == "pytorch"
+
+    def test_framework_from_quoted_experiment_yaml(self, tmp_path):
+        """Test that values the fast path skips are still parsed."""
+        (tmp_path / "experiment.yaml").write_text('name: x\nframework: "tensorflow"\n')
+        assert detect_framework(tmp_path) == "tensorflow"
+
+    def test_load_experiment_config(self, tmp_path):
+        """Test that experiment.yaml is returned along with its framework."""
+        (tmp_path / "experiment.yaml").write_text("framework: pytorch\nresources:\n  gpu: 1\n")
+        config, framework = load_experiment_config(tmp_path)
+        assert framework == "pytorch"
+        assert config["resources"]["gpu"] == 1
+        assert load_experiment_config(tmp_path / "missing") == ({}, None)
+
+    def test_framework_from_requirements(self, tmp_path):
+        """Test detection from requirements.txt."""
+        (tmp_path / "requirements.txt").write_text("numpy\ntorch>=2.0\n")
+        assert detect_framework(tmp_path) == "pytorch"
+
+    def test_framework_ignores_commented_requirements(self, tmp_path):
+        """Test that commented-out requirements are not matched."""
+        (tmp_path / "requirements.txt").write_text("# torch\nTensorFlow==2.15\n")
+        assert detect_framework(tmp_path) == "tensorflow"
+
+    def test_framework_default(self, tmp_path):
+        """Test the sklearn fallback."""
+        assert detect_framework(tmp_path) == "sklearn"
+
+    def test_framework_cache_invalidated_on_change(self, tmp_path, home):
+        """Test that cached results are dropped when inputs change."""
+        import os
+
+        requirements = tmp_path / "requirements.txt"
+        requirements.write_text("torch\n")
+        assert detect_framework(tmp_path) == "pytorch"
+        assert (home / ".mlp" / "cache" / "framework.json").exists()
+
+        requirements.write_text("tensorflow\n")
+        st = requirements.stat()
+        os.utime(requirements, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert detect_framework(tmp_path) == "tensorflow"
+
+
+class TestTerraformOutputs:
+    """Test loading Terraform outputs."""
+
+    def test_outputs_read_from_local_state(self, tmp_path, monkeypatch):
+        """Test that local state is parsed without running terraform."""
+        import json
+        import subprocess
+
+        def fail(*args, **kwargs):
+            raise AssertionError("terraform should not be invoked")
+
+        monkeypatch.setattr(subprocess, "run", fail)
+        state = {
+            "version": 4,
+            "outputs": {"ecr_repository_pytorch": {"value": "repo/pytorch", "type": "string"}},
+        }
+        (tmp_path / "terraform.tfstate").write_text(json.dumps(state))
+
+        outputs = load_terraform_outputs(tmp_path)
+        assert outputs["ecr_repository_pytorch"]["value"] == "repo/pytorch"
+
+    def test_env_images_skip_terraform(self, monkeypatch):
+        """Test that Terraform is not consulted when all images are set."""
+        import mlp.commands.experiment as experiment
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Terraform outputs should not be loaded")
+
+        monkeypatch.setattr(experiment, "load_terraform_outputs", fail)
+        for framework in ("PYTORCH", "TENSORFLOW", "SKLEARN"):
+            monkeypatch.setenv(f"MLP_TRAINING_IMAGE_{framework}", f"img/{framework.lower()}")
+
+        get_training_images.cache_clear()
+        try:
+            images = get_training_images()
+        finally:
+            get_training_images.cache_clear()
+
+        assert images["pytorch"] == "img/pytorch"
+        assert images["simple"] == "img/sklearn"
+
+
 class TestConfigFile:
     """Test generated config.yaml files."""
 
@@ -12,12 +12,61 @@ def test_config_creation():
     assert config.kubernetes.namespace == "ml-platform"
     assert config.mlflow.tracking_uri == "http://localhost:5000"
     assert config.dvc.remote == "s3://mlp-data"
+    assert config.terraform.cache_ttl_seconds == 3600
 
 
-def test_config_model_dump():
+def test_config_to_dict():
     """Test that Config can be serialized."""
     config = Config()
-    data = config.model_dump()
+    data = config.to_dict()
     assert "kubernetes" in data
     assert "mlflow" in data
     assert "dvc" in data
+
+
+def test_config_load_defaults_without_file(tmp_path, monkeypatch):
+    """Test that Config.load returns defaults when no file exists."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config = Config.load()
+    assert config.kubernetes.context == "kind-mlp"
+
+
+def test_config_load_is_cached_until_file_changes(tmp_path, monkeypatch):
+    """Test that Config.load reuses the parsed file until it changes."""
+    import os
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config = Config()
+    config.kubernetes.namespace = "team-a"
+    config.save()
+
+    first = Config.load()
+    assert first.kubernetes.namespace == "team-a"
+    assert Config.load() is first
+
+    config.kubernetes.namespace = "team-b"
+    config.save()
+    config_path = tmp_path / ".mlp" / "config.yaml"
+    st = config_path.stat()
+    os.utime(config_path, (st.st_atime, st.st_mtime + 10))
+
+    assert Config.load().kubernetes.namespace == "team-b"
+
+
+def test_config_save_roundtrip(tmp_path, monkeypatch):
+    """Test that a saved config loads back unchanged."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config = Config()
+    config.mlflow.tracking_uri = "http://mlflow:5000"
+    config.save()
+
+    assert not list((tmp_path / ".mlp").glob("*.tmp"))
+    assert Config.load() == config
+
+
+def test_config_from_dict_ignores_unknown_keys():
+    """Test that partial or unknown config entries are tolerated."""
+    config = Config.from_dict({"kubernetes": {"namespace": "team-a", "extra": 1}, "other": {}})
+    assert config.kubernetes.namespace == "team-a"
+    assert config.kubernetes.context == "kind-mlp"
+    assert config.mlflow.tracking_uri == "http://localhost:5000"
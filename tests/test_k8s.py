@@ -0,0 +1,527 @@
+"""Tests for Kubernetes utilities."""
+
+import base64
+import io
+import tarfile
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from kubernetes.client.rest import ApiException
+from mlp.utils import k8s
+
+
+def make_job(active=None, failed=None, resource_version="1", succeeded=None):
+    """Build a minimal stand-in for a V1Job."""
+    return SimpleNamespace(
+        metadata=SimpleNamespace(resource_version=resource_version),
+        status=SimpleNamespace(active=active, failed=failed, succeeded=succeeded),
+    )
+
+
+class FakeWatch:
+    """Watch replacement that replays scripted event batches."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.calls = []
+
+    def stream(self, func, **kwargs):
+        self.calls.append(kwargs)
+        batch = self.batches.pop(0)
+        if isinstance(batch, Exception):
+            raise batch
+        for obj in batch:
+            yield {"type": "MODIFIED", "object": obj}
+
+    def stop(self):
+        pass
+
+
+@pytest.fixture
+def use_clients(monkeypatch):
+    """Make get_k8s_client return fake APIs instead of loading a kubeconfig."""
+    def install(batch=None, core=None, apps=None):
+        clients = k8s.K8sClients(batch, core, apps)
+        monkeypatch.setattr(k8s, "get_k8s_client", lambda *a, **kw: clients)
+    return install
+
+
+@pytest.fixture
+def fake_clients(use_clients):
+    """Fake clients with a batch API that is only used by watches."""
+    use_clients(batch=SimpleNamespace(list_namespaced_job=lambda *a, **kw: None))
+
+
+class TestWaitForJob:
+    """Test waiting for a job to start."""
+
+    def test_returns_when_job_active(self, monkeypatch, fake_clients):
+        """Test that the wait ends on the first active event."""
+        fake = FakeWatch([[make_job(), make_job(active=1)]])
+        monkeypatch.setattr(k8s.watch, "Watch", lambda: fake)
+
+        k8s.wait_for_job("job-1", "ns", timeout=30)
+        assert fake.calls[0]["field_selector"] == "metadata.name=job-1"
+
+    def test_returns_when_job_already_succeeded(self, monkeypatch, fake_clients):
+        """Test that a job finishing before an active event is seen ends the wait."""
+        fake = FakeWatch([[make_job(), make_job(succeeded=1)]])
+        monkeypatch.setattr(k8s.watch, "Watch", lambda: fake)
+
+        k8s.wait_for_job("job-1", "ns", timeout=30)
+
+    def test_raises_when_job_failed(self, monkeypatch, fake_clients):
+        """Test that a failed job raises."""
+        fake = FakeWatch([[make_job(failed=1)]])
+        monkeypatch.setattr(k8s.watch, "Watch", lambda: fake)
+
+        with pytest.raises(RuntimeError):
+            k8s.wait_for_job("job-1", "ns", timeout=30)
+
+    def test_restarts_after_gone(self, monkeypatch, fake_clients):
+        """Test that an expired resourceVersion restarts the watch."""
+        fake = FakeWatch([
+            [make_job(resource_version="5")],
+            ApiException(status=410),
+            [make_job(active=1)],
+        ])
+        monkeypatch.setattr(k8s.watch, "Watch", lambda: fake)
+
+        k8s.wait_for_job("job-1", "ns", timeout=30)
+        assert fake.calls[1]["resource_version"] == "5"
+        assert "resource_version" not in fake.calls[2]
+
+
+class TestGetK8sClient:
+    """Test API client caching."""
+
+    def test_clients_cached_per_context(self, monkeypatch):
+        """Test that kubeconfig is loaded once per context."""
+        loads = []
+        monkeypatch.setattr(k8s, "_CLIENT_CACHE", {})
+        monkeypatch.setattr(
+            k8s.k8s_config, "load_kube_config", lambda context=None: loads.append(context)
+        )
+
+        first = k8s.get_k8s_client("ctx-a")
+        assert k8s.get_k8s_client("ctx-a") is first
+        assert first.batch.api_client is first.core.api_client is first.apps.api_client
+
+        k8s.get_k8s_client("ctx-b")
+        assert loads == ["ctx-a", "ctx-b"]
+
+    def test_connections_share_ssl_context(self):
+        """Test that CA files are loaded once into a shared SSL context."""
+        import ssl
+        import certifi
+        from kubernetes import client
+
+        configuration = client.Configuration()
+        configuration.ssl_ca_cert = certifi.where()
+        api_client = client.ApiClient(configuration=configuration)
+
+        k8s._share_ssl_context(api_client)
+
+        pool_kw = api_client.rest_client.pool_manager.connection_pool_kw
+        assert isinstance(pool_kw["ssl_context"], ssl.SSLContext)
+        assert pool_kw["ca_certs"] is None
+
+
+class FakeCoreApi:
+    """CoreV1Api replacement that records created ConfigMaps."""
+
+    def __init__(self):
+        self.configmaps = []
+
+    def create_namespaced_config_map(self, namespace, body):
+        self.configmaps.append(body)
+
+
+class TestCreateConfigmap:
+    """Test packaging experiment code into a ConfigMap."""
+
+    def test_packages_files_and_skips_excluded(self, tmp_path):
+        """Test that source files are included and excluded paths skipped."""
+        (tmp_path / "train.py").write_text("print('hi')\n")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "model.py").write_text("x = 1\n")
+        (tmp_path / "weights.bin").write_bytes(b"\xff\xfe\x00")
+        (tmp_path / "__pycache__").mkdir()
+        (tmp_path / "__pycache__" / "train.cpython-311.pyc").write_bytes(b"\x00")
+        (tmp_path / "data").mkdir()
+        (tmp_path / "data" / "train.csv").write_text("a,b\n")
+        (tmp_path / "pkg.egg-info").mkdir()
+        (tmp_path / "pkg.egg-info" / "PKG-INFO").write_text("Name: pkg\n")
+
+        core_api = FakeCoreApi()
+        k8s.create_configmap_from_path("job-code", "ns", tmp_path, core_api)
+
+        configmap = core_api.configmaps[0]
+        assert configmap.data is None
+        archive = base64.b64decode(configmap.binary_data["code.tar.gz"])
+        with tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz") as tar:
+            assert sorted(tar.getnames()) == ["src/model.py", "train.py", "weights.bin"]
+            assert tar.extractfile("weights.bin").read() == b"\xff\xfe\x00"
+
+    def test_oversized_tree_rejected_before_packaging(self, tmp_path, monkeypatch):
+        """Test that a tree too large for any ConfigMap fails without being read."""
+        (tmp_path / "train.py").write_text("x" * 100)
+        monkeypatch.setattr(k8s, "_MAX_CONFIGMAP_SOURCE_BYTES", 50)
+        monkeypatch.setattr(
+            k8s, "write_code_bundle", lambda *a: pytest.fail("files should not be packaged")
+        )
+
+        core_api = FakeCoreApi()
+        with pytest.raises(ValueError, match="code_bundle_uri"):
+            k8s.create_configmap_from_path("job-code", "ns", tmp_path, core_api)
+        assert core_api.configmaps == []
+
+
+def make_object(name):
+    """Build a minimal object with metadata."""
+    return SimpleNamespace(metadata=SimpleNamespace(name=name))
+
+
+def make_pod(name, phase):
+    """Build a minimal stand-in for a V1Pod."""
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name),
+        status=SimpleNamespace(phase=phase),
+    )
+
+
+def make_list(items):
+    """Build a single-page LIST response."""
+    return SimpleNamespace(items=items, metadata=SimpleNamespace(_continue=None))
+
+
+class TestListAll:
+    """Test paginated LISTs."""
+
+    def test_follows_continue_tokens(self):
+        """Test that every page is requested and the items are concatenated."""
+        lists = []
+
+        def list_func(namespace, label_selector=None, limit=None, _continue=None):
+            lists.append((namespace, label_selector, _continue))
+            if _continue is None:
+                return SimpleNamespace(
+                    items=[make_object("job-a")],
+                    metadata=SimpleNamespace(_continue="page-2"),
+                )
+            return make_list([make_object("job-b")])
+
+        items = k8s._list_all(list_func, "ns", label_selector="app=ml-training")
+
+        assert [o.metadata.name for o in items] == ["job-a", "job-b"]
+        assert lists == [("ns", "app=ml-training", None), ("ns", "app=ml-training", "page-2")]
+
+
+class TestSubmitTrainingJob:
+    """Test building training job specs."""
+
+    def test_code_bundle_uses_init_container(self, monkeypatch, tmp_path, use_clients):
+        """Test that a configured bundle URI replaces the ConfigMap volume."""
+        from mlp.config import Config
+
+        created = []
+        batch_api = SimpleNamespace(create_namespaced_job=lambda ns, job: created.append(job))
+        core_api = FakeCoreApi()
+        use_clients(batch=batch_api, core=core_api)
+        monkeypatch.setattr(
+            k8s, "upload_code_bundle",
+            lambda path, uri, job_name: f"https://bucket.s3.amazonaws.com/{job_name}.tar.gz"
+        )
+
+        config = Config()
+        config.kubernetes.code_bundle_uri = "s3://bucket/code"
+        k8s.submit_training_job("exp", tmp_path, "img", "1", "1Gi", 0, {}, config)
+
+        spec = created[0].spec.template.spec
+        assert core_api.configmaps == []
+        assert spec.volumes[0].empty_dir is not None
+        assert spec.init_containers[0].env[0].value.endswith(".tar.gz")
+        assert spec.containers[0].volume_mounts[0].mount_path == "/work"
+        assert created[0].metadata.labels["job"] == created[0].metadata.name
+
+    def test_pip_cache_pvc_is_mounted(self, tmp_path, use_clients):
+        """Test that a configured pip cache claim is mounted and exported."""
+        from mlp.config import Config
+
+        created = []
+        batch_api = SimpleNamespace(create_namespaced_job=lambda ns, job: created.append(job))
+        use_clients(batch=batch_api, core=FakeCoreApi())
+
+        config = Config()
+        config.kubernetes.pip_cache_pvc = "mlp-pip-cache"
+        k8s.submit_training_job("exp", tmp_path, "img", "1", "1Gi", 0, {"A": "1"}, config)
+
+        spec = created[0].spec.template.spec
+        claims = [
+            v.persistent_volume_claim.claim_name
+            for v in spec.volumes
+            if v.persistent_volume_claim
+        ]
+        assert claims == ["mlp-pip-cache"]
+        env = {e.name: e.value for e in spec.containers[0].env}
+        assert env == {"A": "1", "PIP_CACHE_DIR": k8s.PIP_CACHE_DIR}
+
+    def test_job_names_are_unique_and_fit_labels(self, monkeypatch, tmp_path, use_clients):
+        """Test that same-second submissions get distinct, label-safe names."""
+        from mlp.config import Config
+
+        created = []
+        batch_api = SimpleNamespace(create_namespaced_job=lambda ns, job: created.append(job))
+        use_clients(batch=batch_api, core=FakeCoreApi())
+        monkeypatch.setattr(k8s.time, "time", lambda: 1700000000)
+
+        for _ in range(2):
+            k8s.submit_training_job("x" * 50, tmp_path, "img", "1", "1Gi", 0, {}, Config())
+
+        names = [job.metadata.name for job in created]
+        assert names[0] != names[1]
+        assert all(len(name) <= 63 for name in names)
+
+
+class TestDeleteJob:
+    """Test deleting training jobs."""
+
+    def test_deletes_job_and_configmap_by_name(self, use_clients):
+        """Test that the job and its code ConfigMap are deleted by name."""
+        calls = []
+        batch_api = SimpleNamespace(
+            delete_namespaced_job=lambda name, ns, **kw: calls.append(("job", name))
+        )
+        core_api = SimpleNamespace(
+            delete_namespaced_config_map=lambda name, ns: calls.append(("cm", name))
+        )
+        use_clients(batch=batch_api, core=core_api)
+
+        k8s.delete_job("exp-1", "ns")
+
+        assert calls == [("job", "exp-1"), ("cm", "exp-1-code")]
+
+    def test_missing_job_raises(self, use_clients):
+        """Test that deleting an unknown job surfaces the 404."""
+        def delete_namespaced_job(name, ns, **kw):
+            raise ApiException(status=404)
+
+        use_clients(batch=SimpleNamespace(delete_namespaced_job=delete_namespaced_job))
+
+        with pytest.raises(ApiException):
+            k8s.delete_job("typo", "ns")
+
+    def test_missing_configmap_ignored(self, use_clients):
+        """Test that jobs without a code ConfigMap still delete cleanly."""
+        def delete_namespaced_config_map(name, ns):
+            raise ApiException(status=404)
+
+        use_clients(
+            batch=SimpleNamespace(delete_namespaced_job=lambda name, ns, **kw: None),
+            core=SimpleNamespace(delete_namespaced_config_map=delete_namespaced_config_map),
+        )
+
+        k8s.delete_job("exp-1", "ns")
+
+
+class TestStreamJobLogs:
+    """Test following job logs."""
+
+    def test_writes_raw_chunks(self, monkeypatch, capsysbinary, use_clients):
+        """Test that log chunks are passed through as bytes."""
+        calls = []
+
+        class LogCoreApi:
+            def list_namespaced_pod(self, namespace, **kwargs):
+                pass
+
+            def read_namespaced_pod_log(self, name, namespace, **kwargs):
+                calls.append(kwargs)
+                chunks = [b"epoch 1\n", "loss \u2193\n".encode()]
+                return SimpleNamespace(stream=lambda amt: iter(chunks))
+
+        use_clients(core=LogCoreApi())
+        fake = FakeWatch([[make_pod("job-1-abc", "Running")]])
+        monkeypatch.setattr(k8s.watch, "Watch", lambda: fake)
+
+        k8s.stream_job_logs("job-1", "ns")
+
+        assert capsysbinary.readouterr().out == "epoch 1\nloss \u2193\n".encode()
+        assert calls[0]["follow"] is True
+        assert calls[0]["tail_lines"] == 10000
+
+    def test_waits_for_pod_to_start(self, monkeypatch):
+        """Test that pending pods are skipped until one is running."""
+        fake = FakeWatch([[make_pod("job-1-abc", "Pending"), make_pod("job-1-abc", "Running")]])
+        monkeypatch.setattr(k8s.watch, "Watch", lambda: fake)
+        core_api = SimpleNamespace(list_namespaced_pod=None)
+
+        assert k8s._wait_for_job_pod(core_api, "job-1", "ns") == "job-1-abc"
+        assert fake.calls[0]["label_selector"] == "job-name=job-1"
+
+    def test_gives_up_when_no_pod_starts(self, monkeypatch):
+        """Test that None is returned when the watch times out."""
+        fake = FakeWatch([[make_pod("job-1-abc", "Pending")]])
+        monkeypatch.setattr(k8s.watch, "Watch", lambda: fake)
+        core_api = SimpleNamespace(list_namespaced_pod=None)
+
+        assert k8s._wait_for_job_pod(core_api, "job-1", "ns", timeout=1) is None
+
+
+class TestListJobs:
+    """Test listing training jobs."""
+
+    def test_humanize_age(self):
+        """Test age formatting picks the largest whole unit."""
+        assert [k8s._humanize_age(s) for s in (0, 59, 60, 7199, 86400 * 3)] == [
+            "0s", "59s", "1m", "1h", "3d"
+        ]
+
+    def test_completed_filter_runs_on_server(self, use_clients):
+        """Test that the completed filter is sent as a field selector."""
+        calls = []
+        job = SimpleNamespace(
+            metadata=SimpleNamespace(name="exp-1", creation_timestamp=datetime.now(timezone.utc)),
+            status=SimpleNamespace(active=None, succeeded=1, failed=None),
+        )
+
+        def list_namespaced_job(namespace, **kwargs):
+            calls.append(kwargs)
+            return make_list([job])
+
+        batch_api = SimpleNamespace(list_namespaced_job=list_namespaced_job)
+        use_clients(batch=batch_api)
+
+        jobs = k8s.list_jobs("ns", status_filter="completed")
+
+        assert [j["status"] for j in jobs] == ["Completed"]
+        assert calls[0]["field_selector"] == "status.successful!=0"
+
+    def test_lists_training_jobs_by_label(self, use_clients):
+        """Test that other filters LIST labelled jobs and filter client-side."""
+        calls = []
+        now = datetime.now(timezone.utc)
+        jobs = [
+            SimpleNamespace(
+                metadata=SimpleNamespace(name=name, creation_timestamp=now),
+                status=SimpleNamespace(active=active, succeeded=None, failed=failed),
+            )
+            for name, active, failed in (("exp-1", 1, None), ("exp-2", None, 1))
+        ]
+
+        def list_namespaced_job(namespace, **kwargs):
+            calls.append(kwargs)
+            return make_list(jobs)
+
+        batch_api = SimpleNamespace(list_namespaced_job=list_namespaced_job)
+        use_clients(batch=batch_api)
+
+        result = k8s.list_jobs("ns", status_filter="failed")
+
+        assert [j["name"] for j in result] == ["exp-2"]
+        assert calls == [{"label_selector": "app=ml-training", "limit": k8s._LIST_PAGE_SIZE}]
+
+
+class TestGetJobStatus:
+    """Test reading a job's status."""
+
+    def test_reads_job_and_its_pods_concurrently(self, use_clients):
+        """Test that only the job and its own pods are requested, in parallel."""
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+        job = SimpleNamespace(
+            status=SimpleNamespace(
+                active=1, succeeded=None, failed=None, start_time=None, completion_time=None
+            ),
+        )
+        pod = SimpleNamespace(
+            metadata=SimpleNamespace(name="exp-1-abc"),
+            status=SimpleNamespace(phase="Running", container_statuses=None),
+        )
+        selectors = []
+
+        def read_namespaced_job(name, namespace):
+            barrier.wait()
+            return job
+
+        def list_namespaced_pod(namespace, label_selector=None, limit=None):
+            selectors.append(label_selector)
+            barrier.wait()
+            return make_list([pod])
+
+        batch_api = SimpleNamespace(read_namespaced_job=read_namespaced_job)
+        core_api = SimpleNamespace(list_namespaced_pod=list_namespaced_pod)
+        use_clients(batch=batch_api, core=core_api)
+
+        status = k8s.get_job_status("exp-1", "ns")
+
+        assert status["active"] == 1
+        assert [p["name"] for p in status["pods"]] == ["exp-1-abc"]
+        assert selectors == ["job-name=exp-1"]
+
+
+class TestListModelDeployments:
+    """Test listing model deployments."""
+
+    def test_services_fetched_with_one_list(self, use_clients):
+        """Test that service URLs come from a single labelled LIST."""
+        def make_deployment(name):
+            return SimpleNamespace(
+                metadata=SimpleNamespace(name=name, creation_timestamp=datetime.now(timezone.utc)),
+                spec=SimpleNamespace(replicas=1),
+                status=SimpleNamespace(ready_replicas=1),
+            )
+
+        service = SimpleNamespace(
+            metadata=SimpleNamespace(name="iris"),
+            spec=SimpleNamespace(cluster_ip="10.0.0.5", ports=[SimpleNamespace(port=8080)]),
+        )
+        selectors = []
+
+        def list_services(namespace, label_selector=None, limit=None):
+            selectors.append(label_selector)
+            return make_list([service])
+
+        apps_api = SimpleNamespace(
+            list_namespaced_deployment=lambda namespace, label_selector=None, limit=None: make_list(
+                [make_deployment("iris"), make_deployment("wine")]
+            )
+        )
+        core_api = SimpleNamespace(list_namespaced_service=list_services)
+        use_clients(core=core_api, apps=apps_api)
+
+        result = k8s.list_model_deployments("ns")
+
+        assert {d["name"]: d["service_url"] for d in result} == {
+            "iris": "http://10.0.0.5:8080", "wine": None
+        }
+        assert selectors == ["type=model-server"]
+
+    @pytest.mark.parametrize("status_filter,expected", [
+        ("all", ["iris", "wine"]),
+        ("available", ["iris"]),
+        ("unavailable", ["wine"]),
+    ])
+    def test_status_filter(self, status_filter, expected, use_clients):
+        """Test filtering deployments by availability."""
+        def make_deployment(name, ready):
+            return SimpleNamespace(
+                metadata=SimpleNamespace(name=name, creation_timestamp=datetime.now(timezone.utc)),
+                spec=SimpleNamespace(replicas=1),
+                status=SimpleNamespace(ready_replicas=ready),
+            )
+
+        apps_api = SimpleNamespace(
+            list_namespaced_deployment=lambda namespace, label_selector=None, limit=None: make_list(
+                [make_deployment("iris", 1), make_deployment("wine", 0)]
+            )
+        )
+        core_api = SimpleNamespace(
+            list_namespaced_service=lambda namespace, label_selector=None, limit=None: make_list([])
+        )
+        use_clients(core=core_api, apps=apps_api)
+
+        result = k8s.list_model_deployments("ns", status_filter=status_filter)
+
+        assert [d["name"] for d in result] == expected
@@ -0,0 +1,207 @@
+"""Tests for utility modules."""
+
+import io
+import tarfile
+from types import SimpleNamespace
+import click
+import pytest
+from mlp.utils import entrypoint
+from mlp.utils.code_bundle import write_code_bundle
+from mlp.utils.env import parse_env_vars
+from mlp.utils.logger import console, setup_logger
+from mlp.utils.validators import (
+    validate_azure_uri,
+    validate_k8s_namespace,
+    validate_name,
+    validate_path,
+    validate_s3_uri,
+    validate_url,
+)
+
+
+class TestParseEnvVars:
+    """Test KEY=VALUE option parsing."""
+
+    def test_parse_env_vars(self):
+        """Test parsing valid variables."""
+        env = parse_env_vars(["LEARNING_RATE=0.001", "ARGS=--a=1 --b=2", "EMPTY="])
+        assert env == {"LEARNING_RATE": "0.001", "ARGS": "--a=1 --b=2", "EMPTY": ""}
+
+    @pytest.mark.parametrize("item", ["NOVALUE", "=foo", "1ABC=x", "BAD-NAME=x"])
+    def test_parse_env_vars_invalid(self, item):
+        """Test that malformed variables are rejected."""
+        with pytest.raises(click.BadParameter):
+            parse_env_vars([item])
+
+
+class TestValidators:
+    """Test input validators."""
+
+    @pytest.mark.parametrize("name", ["abc", "my-model", "model_v2", "a" * 50])
+    def test_validate_name_valid(self, name):
+        """Test accepted names."""
+        assert validate_name(name)
+
+    @pytest.mark.parametrize(
+        "name", ["ab", "a" * 51, "-model", "My-Model", "my model", "model\n", "mödel"]
+    )
+    def test_validate_name_invalid(self, name):
+        """Test rejected names."""
+        assert not validate_name(name)
+
+    @pytest.mark.parametrize("validator,value,expected", [
+        (validate_s3_uri, "s3://my-bucket/models/v1", True),
+        (validate_s3_uri, "s3://My_Bucket", False),
+        (validate_s3_uri, "s3://my-bucket\n", False),
+        (validate_s3_uri, "s3://my-bucket", True),
+        (validate_azure_uri, "azure://container/path", True),
+        (validate_azure_uri, "azure://a.b", False),
+        (validate_k8s_namespace, "ml-training", True),
+        (validate_k8s_namespace, "a" * 64, False),
+        (validate_k8s_namespace, "-ns", False),
+        (validate_url, "https://mlflow.example.com:5000", True),
+        (validate_url, "ftp://example.com", False),
+    ])
+    def test_uri_and_namespace_validators(self, validator, value, expected):
+        """Test the precompiled URI and namespace patterns."""
+        assert validator(value) is expected
+
+    def test_validate_path(self, tmp_path):
+        """Test path validation with and without an existence check."""
+        assert validate_path(str(tmp_path), must_exist=True)
+        assert not validate_path(str(tmp_path / "missing"), must_exist=True)
+        assert not validate_path("bad\0path", must_exist=True)
+        assert validate_path(str(tmp_path / "missing"))
+        assert not validate_path(None)
+
+
+class TestCodeBundle:
+    """Test packaging experiment code as a tarball."""
+
+    def test_bundle_keeps_layout_and_skips_excluded(self, tmp_path):
+        """Test that files keep their relative paths and excluded paths are skipped."""
+        (tmp_path / "train.py").write_text("print('hi')\n")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "model.py").write_text("x = 1\n")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+
+        buf = io.BytesIO()
+        assert write_code_bundle(tmp_path, buf) == 2
+
+        buf.seek(0)
+        with tarfile.open(fileobj=buf, mode="r:gz") as tar:
+            assert sorted(tar.getnames()) == ["src/model.py", "train.py"]
+            assert tar.extractfile("src/model.py").read() == b"x = 1\n"
+
+    def test_read_ahead_keeps_contents_and_order(self, tmp_path, monkeypatch):
+        """Test that buffered and streamed files are written intact and in walk order."""
+        from mlp.utils import code_bundle
+
+        monkeypatch.setattr(code_bundle, "READ_AHEAD_MAX_BYTES", 8)
+        contents = {f"f{i:02d}.py": (b"x" * i) for i in range(40)}
+        for name, data in contents.items():
+            (tmp_path / name).write_bytes(data)
+
+        buf = io.BytesIO()
+        assert write_code_bundle(tmp_path, buf) == len(contents)
+
+        buf.seek(0)
+        with tarfile.open(fileobj=buf, mode="r:gz") as tar:
+            names = tar.getnames()
+            assert names == [p.name for p in code_bundle.iter_code_files(tmp_path)]
+            assert {name: tar.extractfile(name).read() for name in names} == contents
+
+    def test_symlinks(self, tmp_path):
+        """Test that directory links are not followed and file links are dereferenced."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "train.py").write_text("print('hi')\n")
+        (tmp_path / "a" / "loop").symlink_to("..")
+        (tmp_path / "a" / "dangling").symlink_to("missing.py")
+        outside = tmp_path.parent / f"{tmp_path.name}-shared.py"
+        outside.write_text("SHARED = 1\n")
+        (tmp_path / "shared.py").symlink_to(outside)
+
+        buf = io.BytesIO()
+        assert write_code_bundle(tmp_path, buf) == 2
+
+        buf.seek(0)
+        with tarfile.open(fileobj=buf, mode="r:gz") as tar:
+            assert sorted(tar.getnames()) == ["a/train.py", "shared.py"]
+            member = tar.getmember("shared.py")
+            assert member.isreg()
+            assert tar.extractfile(member).read() == b"SHARED = 1\n"
+
+    def test_excluded_dirs_are_not_walked(self, tmp_path, monkeypatch):
+        """Test that excluded directories are pruned rather than listed."""
+        from mlp.utils import code_bundle
+
+        (tmp_path / "train.py").write_text("")
+        (tmp_path / ".venv" / "lib").mkdir(parents=True)
+        (tmp_path / ".venv" / "lib" / "big.py").write_text("")
+
+        scanned = []
+        real_scandir = code_bundle.os.scandir
+        monkeypatch.setattr(
+            code_bundle.os, "scandir", lambda p: scanned.append(p) or real_scandir(p)
+        )
+
+        assert [f.name for f in code_bundle.iter_code_files(tmp_path)] == ["train.py"]
+        assert scanned == [str(tmp_path)]
+
+
+class TestSetupLogger:
+    """Test logger configuration."""
+
+    @pytest.mark.parametrize("debug,show_locals", [(None, False), ("1", True)])
+    def test_traceback_locals_only_when_debugging(self, monkeypatch, debug, show_locals):
+        """Test that traceback locals are only rendered with MLP_DEBUG=1."""
+        if debug is None:
+            monkeypatch.delenv("MLP_DEBUG", raising=False)
+        else:
+            monkeypatch.setenv("MLP_DEBUG", debug)
+
+        logger = setup_logger(f"test.logger.{show_locals}")
+        logger.info("first record")
+
+        assert logger.handlers[0].handler.tracebacks_show_locals is show_locals
+
+    def test_console_created_on_first_record(self):
+        """Test that setting up a logger does not build the console."""
+        console.cache_clear()
+        logger = setup_logger("test.logger.lazy")
+        assert console.cache_info().currsize == 0
+
+        logger.info("first record")
+
+        assert console.cache_info().currsize == 1
+
+
+class TestEntrypoint:
+    """Test the training container entrypoint."""
+
+    def test_unpacks_installs_and_execs(self, tmp_path, monkeypatch):
+        """Test that the archive is unpacked before pip and train.py run."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "train.py").write_text("print('hi')\n")
+        (src / "requirements.txt").write_text("numpy\n")
+        archive = tmp_path / "code.tar.gz"
+        with open(archive, "wb") as f:
+            write_code_bundle(src, f)
+
+        work = tmp_path / "work"
+        calls = []
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(entrypoint, "WORK_DIR", str(work))
+        monkeypatch.setattr(
+            entrypoint.subprocess, "run",
+            lambda cmd: calls.append(cmd[1:]) or SimpleNamespace(returncode=0)
+        )
+        monkeypatch.setattr(entrypoint.os, "execv", lambda path, args: calls.append(args[1:]))
+
+        entrypoint.main(["-c", str(archive)])
+
+        assert (work / "train.py").exists()
+        assert calls == [["-m", "pip", "install", "-r", "requirements.txt"], ["train.py"]]
+